@@ -8,9 +8,30 @@ web searches and Claude API synthesis across 7 research domains.
 __version__ = "1.0.0"
 __author__ = "Patient Journey Builder Team"
 
-from .config import Settings
-from .core import PatientJourneyOrchestrator, SessionManager
-from .models import PatientJourneyDatabase, DomainData
+# Top-level exports served lazily (PEP 562, as in domains/__init__):
+# eager imports here would pull pydantic, httpx, tenacity, structlog
+# and tiktoken into every package import, which the cheap CLI paths
+# (--version, status, countries) never need
+_LAZY_EXPORTS = {
+    "Settings": "config",
+    "PatientJourneyOrchestrator": "core",
+    "SessionManager": "core",
+    "PatientJourneyDatabase": "models",
+    "DomainData": "models",
+}
+
+
+def __getattr__(name: str):
+    """Resolve top-level exports lazily so package import stays cheap."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Settings",
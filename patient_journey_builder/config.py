@@ -4,6 +4,8 @@ Configuration module for Patient Journey Builder.
 Uses Pydantic Settings for environment variable support and validation.
 """
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
 from typing import Optional, Literal
@@ -44,6 +46,24 @@ class Settings(BaseSettings):
         default=3,
         description="Number of top results to fetch full content for"
     )
+    max_chars_per_doc: int = Field(
+        default=8000,
+        ge=1000,
+        le=32000,
+        description="Maximum characters of page content sent to synthesis per source"
+    )
+    search_concurrency: int = Field(
+        default=3,
+        ge=1,
+        le=10,
+        description="Maximum concurrent in-flight searches per domain"
+    )
+    max_domain_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=7,
+        description="Number of domains to research in parallel (1 = sequential)"
+    )
 
     # Rate limiting (base values - adaptive limiter adjusts these)
     search_delay_seconds: float = Field(
@@ -132,7 +152,8 @@ class Settings(BaseSettings):
     def ensure_directories_exist(cls, v: str) -> str:
         """Create directories if they don't exist."""
         path = Path(v)
-        path.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            path.mkdir(parents=True, exist_ok=True)
         return str(path)
 
     @field_validator("anthropic_api_key", "brave_api_key", mode="before")
@@ -144,10 +165,12 @@ class Settings(BaseSettings):
         return v
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings.
 
-    Returns cached settings instance for efficiency.
+    Returns cached settings instance for efficiency: the .env parse,
+    key validation and directory creation run once per process.
     """
     return Settings()
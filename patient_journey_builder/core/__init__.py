@@ -3,7 +3,23 @@ Core orchestration components.
 """
 
 from .session_manager import SessionManager, list_sessions
-from .orchestrator import PatientJourneyOrchestrator
+
+
+def __getattr__(name: str):
+    """
+    Resolve the orchestrator lazily (PEP 562).
+
+    Its module drags in the full research stack (config, domains,
+    search, synthesis), which session-only callers like the status CLI
+    never need.
+    """
+    if name == "PatientJourneyOrchestrator":
+        from .orchestrator import PatientJourneyOrchestrator
+
+        globals()[name] = PatientJourneyOrchestrator
+        return PatientJourneyOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "SessionManager",
@@ -2,9 +2,15 @@
 Main orchestrator for patient journey database creation.
 """
 
+import asyncio
+import functools
+import hashlib
+import threading
 import time
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 import logging
 
 from ..config import Settings
@@ -16,8 +22,6 @@ from ..models import (
     SearchLogEntry,
     QualitySummary,
 )
-from ..search import SearchCache, BraveSearchClient, WebFetcher
-from ..synthesis import ClaudeSynthesizer
 from ..domains import get_domain, get_all_domains
 from ..utils import (
     CostTracker,
@@ -28,6 +32,47 @@ from .session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# Country name -> two-letter country code for search localization
+_COUNTRY_CODES = {
+    'sweden': 'SE',
+    'germany': 'DE',
+    'united kingdom': 'GB',
+    'uk': 'GB',
+    'france': 'FR',
+    'spain': 'ES',
+    'italy': 'IT',
+    'netherlands': 'NL',
+    'belgium': 'BE',
+    'denmark': 'DK',
+    'norway': 'NO',
+    'finland': 'FI',
+    'usa': 'US',
+    'united states': 'US',
+    'canada': 'CA',
+    'australia': 'AU',
+    'japan': 'JP',
+}
+
+# Extractions shorter than this are almost always error pages or
+# cookie walls; sending them to synthesis wastes tokens
+_MIN_CONTENT_CHARS = 200
+
+
+def _result_to_dict(result) -> dict:
+    """
+    Convert a SearchResult to the plain dict the synthesizer consumes.
+
+    Direct field access instead of model_dump(): the synthesis context
+    only needs these four fields, and this skips a full Pydantic schema
+    walk per result (hundreds per run).
+    """
+    return {
+        'title': result.title,
+        'url': result.url,
+        'description': result.description,
+        'source': result.source,
+    }
+
 
 class PatientJourneyOrchestrator:
     """
@@ -55,6 +100,13 @@ class PatientJourneyOrchestrator:
             cost_tracker: Optional cost tracker
             use_cache: Whether to use caching
         """
+        # Imported here rather than at module top: these transitively pull
+        # in httpx, anthropic and BeautifulSoup, which status/session CLI
+        # paths importing this package never need
+        import httpx
+        from ..search import SearchCache, BraveSearchClient, WebFetcher
+        from ..synthesis import ClaudeSynthesizer
+
         self.config = config
 
         # Initialize cache
@@ -71,28 +123,53 @@ class PatientJourneyOrchestrator:
             base_delay=0.5
         )
 
+        # Shared HTTP session so keep-alive connections amortize
+        # across search and fetch traffic
+        self._http = httpx.Client(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32),
+            headers={"User-Agent": WebFetcher.USER_AGENT}
+        )
+
         # Initialize clients
         self.search_client = BraveSearchClient(
             api_key=config.brave_api_key,
             cache=self.cache,
-            rate_limiter=self.search_rate_limiter
+            rate_limiter=self.search_rate_limiter,
+            session=self._http
         )
 
         self.web_fetcher = WebFetcher(
             cache=self.cache,
             rate_limiter=self.fetch_rate_limiter,
-            enable_pdf=config.enable_pdf_extraction
+            enable_pdf=config.enable_pdf_extraction,
+            session=self._http
         )
 
         # Cost tracker
         self.cost_tracker = cost_tracker
 
-        # Initialize synthesizer (created per-run to use cost tracker)
-        self.synthesizer: Optional[ClaudeSynthesizer] = None
+        # Synthesizer is constructed once; the Anthropic client keeps
+        # its HTTP connection pool warm across runs
+        self.synthesizer = ClaudeSynthesizer(
+            api_key=config.anthropic_api_key,
+            model=config.claude_model,
+            max_output_tokens=config.max_output_tokens,
+            cost_tracker=cost_tracker
+        )
 
         # Progress logger
         self.progress = ProgressLogger()
 
+        # Checkpoint writer: session saves run off the research thread so
+        # domain work is not blocked on serialization and disk I/O; a
+        # single worker keeps writes ordered
+        self._checkpoint_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="checkpoint"
+        )
+        self._last_checkpoint: Optional[Future] = None
+
         # Get all domains
         self.domains = get_all_domains()
 
@@ -132,82 +209,152 @@ class PatientJourneyOrchestrator:
             self.cost_tracker.run_costs.disease = disease
             self.cost_tracker.run_costs.country = country
 
-        # Initialize synthesizer with cost tracker
-        self.synthesizer = ClaudeSynthesizer(
-            api_key=self.config.anthropic_api_key,
-            model=self.config.claude_model,
-            max_output_tokens=self.config.max_output_tokens,
-            cost_tracker=self.cost_tracker
-        )
+        # Point the shared synthesizer at the current cost tracker
+        self.synthesizer.cost_tracker = self.cost_tracker
 
         # Log session start
         self.progress.session_start(disease, country, start_domain, end_domain)
 
-        # Process each domain
-        for domain_id in range(start_domain, end_domain + 1):
-            domain = self.domains[domain_id]
-            domain_start = time.time()
+        # Process domains, optionally in parallel (they are independent
+        # search+synthesize pipelines; shared state is guarded by a lock)
+        domain_ids = list(range(start_domain, end_domain + 1))
+        max_workers = min(len(domain_ids), self.config.max_domain_concurrency)
+        save_lock = threading.Lock()
+
+        if max_workers <= 1:
+            for domain_id in domain_ids:
+                self._run_single_domain(
+                    domain_id, disease, country, major_city,
+                    database, session_manager, save_lock
+                )
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._run_single_domain,
+                        domain_id, disease, country, major_city,
+                        database, session_manager, save_lock
+                    ): domain_id
+                    for domain_id in domain_ids
+                }
+                for future in as_completed(futures):
+                    # Re-raise strict-mode failures from worker threads
+                    future.result()
 
-            # Start domain tracking
-            if self.cost_tracker:
-                self.cost_tracker.start_domain(domain_id, domain.domain_name)
+        # Finalize
+        database.overall_status = "completed"
+        database.completeness_score = database.calculate_completeness()
 
-            self.progress.domain_start(
-                domain_id,
-                domain.domain_name,
-                len(domain.search_queries)
-            )
+        # Calculate total cost
+        if self.cost_tracker:
+            database.total_cost_usd = self.cost_tracker.run_costs.total_cost
 
-            try:
-                # Execute domain research
-                domain_data = self._execute_domain(
-                    domain=domain,
-                    disease=disease,
-                    country=country,
-                    major_city=major_city
-                )
+        # Drain queued checkpoints, then write the final state synchronously
+        if self._last_checkpoint is not None:
+            self._last_checkpoint.result()
+        session_manager.save(database)
+
+        # Log final summary
+        run_duration = time.time() - run_start
+        self.progress.final_summary(
+            disease=disease,
+            country=country,
+            completeness=database.completeness_score,
+            total_duration=run_duration,
+            total_cost=database.total_cost_usd
+        )
 
-                # Validate completeness
-                is_complete, gaps = domain.validate_completeness(domain_data)
+        return database
 
-                domain_duration = time.time() - domain_start
+    def _run_single_domain(
+        self,
+        domain_id: int,
+        disease: str,
+        country: str,
+        major_city: str,
+        database: PatientJourneyDatabase,
+        session_manager: SessionManager,
+        save_lock: threading.Lock
+    ) -> None:
+        """
+        Research one domain and checkpoint the result.
 
-                if not is_complete:
-                    if self.config.strict_mode:
-                        raise ValueError(f"Domain {domain_id} validation failed: {gaps}")
+        Safe to call from worker threads: mutations of the shared
+        database and session saves are serialized via save_lock.
 
-                    domain_data.status = DomainStatus.COMPLETED
-                    domain_data.quality_summary.validation_gaps = gaps
-                else:
-                    domain_data.status = DomainStatus.COMPLETED
+        Args:
+            domain_id: Domain number (1-7)
+            disease: Disease name
+            country: Target country
+            major_city: Major city for localization
+            database: Shared database being populated
+            session_manager: Session manager for checkpoint saves
+            save_lock: Lock guarding database mutation and saves
+        """
+        domain = self.domains[domain_id]
+        domain_start = time.time()
 
-                domain_data.completed_at = datetime.now()
+        # Start domain tracking
+        if self.cost_tracker:
+            self.cost_tracker.start_domain(domain_id, domain.domain_name)
 
-                # Log domain completion
-                self.progress.domain_complete(
-                    domain_id=domain_id,
-                    tables_populated=len(domain_data.tables),
-                    gaps=gaps,
-                    duration_seconds=domain_duration
-                )
+        self.progress.domain_start(
+            domain_id,
+            domain.domain_name,
+            len(domain.search_queries)
+        )
+
+        try:
+            # Execute domain research
+            domain_data = self._execute_domain(
+                domain=domain,
+                disease=disease,
+                country=country,
+                major_city=major_city
+            )
+
+            # Validate completeness
+            is_complete, gaps = domain.validate_completeness(domain_data)
+
+            domain_duration = time.time() - domain_start
+
+            if not is_complete:
+                if self.config.strict_mode:
+                    raise ValueError(f"Domain {domain_id} validation failed: {gaps}")
 
-                # End domain cost tracking
-                if self.cost_tracker:
-                    self.cost_tracker.end_domain(domain_duration)
+                domain_data.status = DomainStatus.COMPLETED
+                domain_data.quality_summary.validation_gaps = gaps
+            else:
+                domain_data.status = DomainStatus.COMPLETED
 
-                # Save to database
+            domain_data.completed_at = datetime.now()
+
+            # Log domain completion
+            self.progress.domain_complete(
+                domain_id=domain_id,
+                tables_populated=len(domain_data.tables),
+                gaps=gaps,
+                duration_seconds=domain_duration
+            )
+
+            # End domain cost tracking
+            if self.cost_tracker:
+                self.cost_tracker.end_domain(domain_duration)
+
+            # Save to database and checkpoint
+            with save_lock:
                 database.set_domain(domain_data)
-                database.current_domain = domain_id + 1
+                database.current_domain = session_manager.get_resume_point(database)
+                self._checkpoint_async(session_manager, database)
 
-                # Checkpoint save
-                session_manager.save(database)
-                self.progress.checkpoint_saved(session_manager.session_id)
+            self.progress.checkpoint_saved(session_manager.session_id)
 
-            except Exception as e:
-                logger.error(f"Domain {domain_id} failed: {e}")
-                self.progress.domain_failed(domain_id, str(e))
+        except Exception as e:
+            logger.error(f"Domain {domain_id} failed: {e}")
+            self.progress.domain_failed(domain_id, str(e))
 
-                # Save failed state
+            # Save failed state
+            with save_lock:
                 if domain_id not in database.domains:
                     database.domains[domain_id] = DomainData(
                         domain_id=domain_id,
@@ -220,33 +367,32 @@ class PatientJourneyOrchestrator:
                 else:
                     database.domains[domain_id].status = DomainStatus.FAILED
 
-                session_manager.save(database)
-
-                if self.config.strict_mode:
-                    raise
+                self._checkpoint_async(session_manager, database)
 
-        # Finalize
-        database.overall_status = "completed"
-        database.completeness_score = database.calculate_completeness()
+            if self.config.strict_mode:
+                raise
 
-        # Calculate total cost
-        if self.cost_tracker:
-            database.total_cost_usd = self.cost_tracker.run_costs.total_cost
+    def _checkpoint_async(
+        self,
+        session_manager: SessionManager,
+        database: PatientJourneyDatabase
+    ) -> None:
+        """
+        Queue a session checkpoint without blocking the caller.
 
-        session_manager.save(database)
+        Must be called with the save lock held: a deep snapshot is taken
+        so the background write sees a consistent state while research
+        continues mutating the live database.
 
-        # Log final summary
-        run_duration = time.time() - run_start
-        self.progress.final_summary(
-            disease=disease,
-            country=country,
-            completeness=database.completeness_score,
-            total_duration=run_duration,
-            total_cost=database.total_cost_usd
+        Args:
+            session_manager: Session manager performing the save
+            database: Database to snapshot and persist
+        """
+        snapshot = database.model_copy(deep=True)
+        self._last_checkpoint = self._checkpoint_executor.submit(
+            session_manager.save, snapshot
         )
 
-        return database
-
     def _execute_domain(
         self,
         domain,
@@ -257,6 +403,10 @@ class PatientJourneyOrchestrator:
         """
         Execute research for a single domain.
 
+        Runs the async search/fetch pipeline in its own event loop,
+        closing that loop's async clients when the domain completes
+        (clients are per-loop, so parallel domains are unaffected).
+
         Args:
             domain: Domain instance
             disease: Disease name
@@ -266,76 +416,180 @@ class PatientJourneyOrchestrator:
         Returns:
             DomainData with research results
         """
-        domain_data = domain.create_domain_data()
-        domain_data.status = DomainStatus.IN_PROGRESS
+        async def runner() -> DomainData:
+            try:
+                return await self._execute_domain_async(
+                    domain, disease, country, major_city
+                )
+            finally:
+                await self.search_client.aclose()
+                await self.web_fetcher.aclose()
 
-        # Generate search queries
-        queries = domain.generate_search_queries(disease, country, major_city)
+        return asyncio.run(runner())
 
-        # Execute searches
-        all_results = []
-        all_contents = []
-        search_log = []
-        cached_count = 0
+    async def _execute_domain_async(
+        self,
+        domain,
+        disease: str,
+        country: str,
+        major_city: str
+    ) -> DomainData:
+        """
+        Execute research for a single domain concurrently.
 
-        for i, query in enumerate(queries):
-            self.progress.search_progress(i + 1, len(queries), query)
+        Searches are dispatched in parallel (bounded by a semaphore to
+        respect API rate limits), and each query's top results are
+        fetched with a single gather. Result ordering is preserved via
+        indexed assignment so logs match the query order.
 
-            # Execute search
-            results, was_cached = self.search_client.search(
-                query=query,
-                country=self._get_country_code(country),
-                count=self.config.max_search_results
-            )
+        Args:
+            domain: Domain instance
+            disease: Disease name
+            country: Target country
+            major_city: Major city for localization
 
-            if was_cached:
-                cached_count += 1
+        Returns:
+            DomainData with research results
+        """
+        domain_data = domain.create_domain_data()
+        domain_data.status = DomainStatus.IN_PROGRESS
 
-            # Track in cost tracker
-            if self.cost_tracker:
-                self.cost_tracker.record_search(cached=was_cached)
+        # Generate search queries
+        queries = domain.generate_search_queries(disease, country, major_city)
+        country_code = self._get_country_code(country)
+        top_k = self.config.top_results_to_fetch
+
+        # Bind hot attributes once; run_query executes per query and these
+        # lookups would otherwise repeat on every invocation
+        num_queries = len(queries)
+        progress = self.progress
+        cost_tracker = self.cost_tracker
+        search_async = self.search_client.search_async
+        fetch_many = self.web_fetcher.fetch_many
+        max_results = self.config.max_search_results
+
+        # Bound in-flight searches to avoid hammering the API
+        semaphore = asyncio.Semaphore(self.config.search_concurrency)
+
+        async def run_query(index: int, query: str) -> tuple:
+            """Search one query and fetch its top results."""
+            async with semaphore:
+                progress.search_progress(index + 1, num_queries, query)
+
+                results, was_cached = await search_async(
+                    query=query,
+                    country=country_code,
+                    count=max_results
+                )
 
-            # Add top results
-            for result in results[:self.config.top_results_to_fetch]:
-                all_results.append(result.model_dump())
+            # Track in cost tracker
+            if cost_tracker:
+                cost_tracker.record_search(cached=was_cached)
 
-                # Fetch content
-                fetched = self.web_fetcher.fetch(result.url)
+            # Fetch top results concurrently
+            top_results = results[:top_k]
+            fetched_list = await fetch_many(
+                [r.url for r in top_results]
+            )
 
-                if self.cost_tracker:
-                    self.cost_tracker.record_fetch(
+            contents = []
+            for fetched in fetched_list:
+                if cost_tracker:
+                    cost_tracker.record_fetch(
                         cached=fetched.fetch_time_ms == 0,
                         success=fetched.success
                     )
+                contents.append(fetched.content if fetched.success else None)
 
-                all_contents.append(fetched.content if fetched.success else None)
-
-            # Log search
-            search_log.append(SearchLogEntry(
+            log_entry = SearchLogEntry(
                 query=query,
                 source_found=results[0].source if results else "",
                 key_data_points=f"Found {len(results)} results",
                 cached=was_cached,
                 results_count=len(results)
-            ))
+            )
 
-            # Rate limiting between queries
-            if not was_cached and i < len(queries) - 1:
-                time.sleep(self.config.search_delay_seconds)
+            return top_results, contents, log_entry, was_cached
+
+        # Dispatch all queries; keep results indexed by query position
+        outcomes = await asyncio.gather(
+            *(run_query(i, q) for i, q in enumerate(queries)),
+            return_exceptions=True
+        )
+
+        # Pre-sized slots, assigned by index so out-of-order completion
+        # still yields query-ordered results without re-sorting
+        log_ts = datetime.now()  # one clock read for the whole batch
+        search_log: List[Optional[SearchLogEntry]] = [None] * num_queries
+        all_results: List[Optional[dict]] = [None] * (num_queries * top_k)
+        all_contents: List[Optional[str]] = [None] * (num_queries * top_k)
+        cached_count = 0
+
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Search failed for query '{queries[i][:50]}': {outcome}")
+                search_log[i] = SearchLogEntry(
+                    query=queries[i],
+                    key_data_points=f"Search failed: {outcome}",
+                    timestamp=log_ts,
+                    results_count=0
+                )
+                continue
+
+            top_results, contents, log_entry, was_cached = outcome
+
+            if was_cached:
+                cached_count += 1
+
+            for j, (result, content) in enumerate(zip(top_results, contents)):
+                all_results[i * top_k + j] = _result_to_dict(result)
+                all_contents[i * top_k + j] = content
+
+            search_log[i] = log_entry
+
+        # Compact slots left empty by queries with fewer than top_k results
+        all_contents = [c for r, c in zip(all_results, all_contents) if r is not None]
+        all_results = [r for r in all_results if r is not None]
+        search_log = [entry for entry in search_log if entry is not None]
+
+        # Trim the synthesis payload: page text is the dominant input-token
+        # cost. Duplicate pages (same text behind different URLs) are sent
+        # once, near-empty extractions are dropped, and each page is capped
+        # at max_chars_per_doc. Slots stay aligned with all_results; a None
+        # content renders as "not available" in the context.
+        max_chars = self.config.max_chars_per_doc
+        seen_hashes = set()
+        for idx, content in enumerate(all_contents):
+            if content is None:
+                continue
+            if len(content) < _MIN_CONTENT_CHARS:
+                all_contents[idx] = None
+                continue
+            digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+            if digest in seen_hashes:
+                all_contents[idx] = None
+                continue
+            seen_hashes.add(digest)
+            if len(content) > max_chars:
+                all_contents[idx] = content[:max_chars]
 
         self.progress.search_complete(len(all_results), cached_count)
 
         # Synthesize results
         self.progress.synthesis_start(len(all_results))
 
-        synthesis_prompt = domain.get_synthesis_prompt(disease, country)
+        # Split the prompt so the shared prefix can be served from the
+        # Anthropic prompt cache on all but the first domain call
+        static_prefix = domain.get_static_prompt_prefix(disease, country)
+        synthesis_prompt = domain.get_domain_specific_suffix()
 
         parse_result, metrics = self.synthesizer.synthesize_domain(
             domain_prompt=synthesis_prompt,
             search_results=all_results,
             page_contents=all_contents,
             required_tables=domain.required_tables,
-            max_retries=self.config.max_synthesis_retries
+            max_retries=self.config.max_synthesis_retries,
+            static_prefix=static_prefix
         )
 
         # Build domain data from results
@@ -343,23 +597,27 @@ class PatientJourneyOrchestrator:
         domain_data.raw_synthesis_output = parse_result.raw_output
 
         # Convert parsed tables to DataTable objects
-        for table_name, table_data in parse_result.tables.items():
-            domain_data.tables.append(DataTable(
+        domain_data.tables = [
+            DataTable(
                 table_name=table_name,
                 headers=table_data.get('headers', []),
                 rows=table_data.get('rows', []),
                 sources=table_data.get('sources', []),
                 confidence_level=table_data.get('confidence_level', 'MEDIUM'),
                 data_gaps=table_data.get('data_gaps', [])
-            ))
+            )
+            for table_name, table_data in parse_result.tables.items()
+        ]
 
-        # Quality summary
+        # Quality summary (bind the property once; each access re-reads
+        # the underlying parsed dict)
+        qs = parse_result.quality_summary
         domain_data.quality_summary = QualitySummary(
-            searches_completed=len(queries),
+            searches_completed=num_queries,
             tables_populated=len(domain_data.tables),
-            confidence_level=parse_result.quality_summary.get('confidence_level', 'MEDIUM'),
-            primary_source_quality=parse_result.quality_summary.get('primary_source_quality', 'MEDIUM'),
-            data_recency=parse_result.quality_summary.get('data_recency', 'Unknown'),
+            confidence_level=qs.get('confidence_level', 'MEDIUM'),
+            primary_source_quality=qs.get('primary_source_quality', 'MEDIUM'),
+            data_recency=qs.get('data_recency', 'Unknown'),
             parse_method=parse_result.parse_method
         )
 
@@ -370,36 +628,22 @@ class PatientJourneyOrchestrator:
 
         return domain_data
 
-    def _get_country_code(self, country: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _get_country_code(country: str) -> str:
         """
         Get two-letter country code.
 
+        Memoized: called once per domain, always with the same country
+        within a run.
+
         Args:
             country: Country name
 
         Returns:
             Two-letter country code
         """
-        country_codes = {
-            'sweden': 'SE',
-            'germany': 'DE',
-            'united kingdom': 'GB',
-            'uk': 'GB',
-            'france': 'FR',
-            'spain': 'ES',
-            'italy': 'IT',
-            'netherlands': 'NL',
-            'belgium': 'BE',
-            'denmark': 'DK',
-            'norway': 'NO',
-            'finland': 'FI',
-            'usa': 'US',
-            'united states': 'US',
-            'canada': 'CA',
-            'australia': 'AU',
-            'japan': 'JP',
-        }
-        return country_codes.get(country.lower(), 'US')
+        return _COUNTRY_CODES.get(country.casefold(), 'US')
 
     def estimate_run(
         self,
@@ -445,5 +689,7 @@ class PatientJourneyOrchestrator:
 
     def close(self) -> None:
         """Clean up resources."""
+        self._checkpoint_executor.shutdown(wait=True)
         self.search_client.close()
         self.web_fetcher.close()
+        self._http.close()
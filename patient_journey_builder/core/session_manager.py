@@ -4,6 +4,11 @@ Session management for persistent state and resumption.
 
 import json
 import fcntl
+import mmap
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -13,6 +18,150 @@ from ..models import PatientJourneyDatabase, DomainStatus
 
 logger = logging.getLogger(__name__)
 
+# Session ID normalization: spaces/hyphens become underscores in one
+# C-level pass, then any remaining non-word characters are stripped
+_SEPARATOR_TRANS = str.maketrans(' -', '__')
+_NON_WORD_RE = re.compile(r'[^\w]')
+
+# Try to import orjson for faster checkpoint serialization
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# Try to import ijson for streaming status reads of large sessions
+try:
+    import ijson
+    IJSON_SUPPORT = True
+except ImportError:
+    IJSON_SUPPORT = False
+
+# Session files below this size are parsed outright; streaming only
+# pays off once table data dominates the file
+_STREAM_THRESHOLD_BYTES = 64 * 1024
+
+# Directory index maintained on save/delete so listings avoid
+# opening and parsing every session file
+_INDEX_FILENAME = "_index.json"
+
+# The seven research domains; the sentinel past the last ID means
+# "all complete" to resume logic
+_DOMAIN_IDS = tuple(range(1, 8))
+_ALL_COMPLETE = _DOMAIN_IDS[-1] + 1
+
+
+def _dumps_session(data: dict, pretty: bool = False) -> bytes:
+    """
+    Serialize session data to JSON bytes.
+
+    Compact by default: checkpoints are written while an exclusive lock
+    is held, and indentation only inflates the payload written inside
+    that critical section. Pass pretty=True where a human-readable file
+    is wanted. Uses orjson when available (several times faster on the
+    checkpoint hot path), falling back to the stdlib encoder.
+
+    Callers must pass JSON-native data: to_session_dict dumps in
+    mode="json", which already materializes datetimes as ISO strings,
+    so no per-value default callback is needed here.
+    """
+    if ORJSON_SUPPORT:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _loads_session(raw) -> dict:
+    """
+    Parse session JSON from bytes or a buffer.
+
+    Uses orjson when available (the stdlib parser loops in Python
+    per-key), falling back to the stdlib decoder.
+    """
+    if ORJSON_SUPPORT:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_session_file(path: Path) -> dict:
+    """
+    Read and parse a session file through a memory map.
+
+    Mapping the file hands the parser a direct view of the OS page
+    cache instead of copying the bytes into an intermediate buffer
+    first; list_sessions scans every file in the session directory,
+    so the saved copy adds up. Raises the same errors as a plain
+    open/parse on failure.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return _loads_session(f.read())
+
+        try:
+            if ORJSON_SUPPORT:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+            return json.loads(mm[:])
+        finally:
+            mm.close()
+
+
+def _project_status(path: Path) -> dict:
+    """
+    Project the status fields from a session file.
+
+    Status listings only need the handful of top-level scalar fields
+    plus a count of completed domains. Small files are parsed outright;
+    once table data dominates the file, stream-parse with ijson (when
+    installed) so the scan never materializes the nested domain data.
+
+    Args:
+        path: Session file path
+
+    Returns:
+        Dict of top-level scalar fields plus 'domains_completed'
+    """
+    if not IJSON_SUPPORT or path.stat().st_size < _STREAM_THRESHOLD_BYTES:
+        data = _read_session_file(path)
+        summary = {
+            key: value for key, value in data.items()
+            if not isinstance(value, (dict, list))
+        }
+        summary['domains_completed'] = sum(
+            1 for d in data.get('domains', {}).values()
+            if d.get('status') == 'completed'
+        )
+        return summary
+
+    summary = {}
+    domains_completed = 0
+
+    try:
+        with open(path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if event in ('start_map', 'end_map', 'start_array',
+                             'end_array', 'map_key'):
+                    continue
+                if prefix and '.' not in prefix:
+                    summary[prefix] = value
+                elif (prefix.startswith('domains.')
+                        and prefix.endswith('.status')
+                        and value == 'completed'):
+                    domains_completed += 1
+    except ijson.JSONError as e:
+        raise ValueError(str(e)) from e
+
+    summary['domains_completed'] = domains_completed
+    return summary
+
 
 class SessionManager:
     """
@@ -25,6 +174,8 @@ class SessionManager:
     - File locking for safe concurrent access
     """
 
+    __slots__ = ('disease', 'country', 'session_dir', 'session_id', 'session_file')
+
     def __init__(
         self,
         disease: str,
@@ -59,14 +210,10 @@ class SessionManager:
         Returns:
             Session ID string
         """
-        # Normalize: lowercase, replace spaces with underscores
-        country_norm = country.lower().replace(' ', '_').replace('-', '_')
-        disease_norm = disease.lower().replace(' ', '_').replace('-', '_')
-
-        # Remove special characters
-        import re
-        country_norm = re.sub(r'[^\w]', '', country_norm)
-        disease_norm = re.sub(r'[^\w]', '', disease_norm)
+        # Normalize: lowercase, separators to underscores, then strip
+        # any remaining special characters
+        country_norm = _NON_WORD_RE.sub('', country.lower().translate(_SEPARATOR_TRANS))
+        disease_norm = _NON_WORD_RE.sub('', disease.lower().translate(_SEPARATOR_TRANS))
 
         return f"{country_norm}_{disease_norm}"
 
@@ -90,11 +237,11 @@ class SessionManager:
             PatientJourneyDatabase instance
         """
         try:
-            with open(self.session_file, 'r') as f:
+            with open(self.session_file, 'rb') as f:
                 # Acquire shared lock for reading
                 fcntl.flock(f.fileno(), fcntl.LOCK_SH)
                 try:
-                    data = json.load(f)
+                    data = _loads_session(f.read())
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
@@ -133,7 +280,11 @@ class SessionManager:
         """
         Persist session state to disk.
 
-        Uses file locking for safe concurrent access.
+        Writes to a sibling temp file, fsyncs, then renames it over the
+        session file. The rename is atomic on POSIX, so readers always
+        see a complete checkpoint and a crash mid-write can no longer
+        corrupt the session (the old truncate-in-place write left a
+        window where progress was lost).
 
         Args:
             database: Database to save
@@ -141,21 +292,63 @@ class SessionManager:
         database.updated_at = datetime.now()
         database.completeness_score = database.calculate_completeness()
 
+        tmp_file = self.session_file.with_suffix('.json.tmp')
+
         try:
-            with open(self.session_file, 'w') as f:
-                # Acquire exclusive lock for writing
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    json.dump(database.to_session_dict(), f, indent=2, default=str)
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps_session(database.to_session_dict()))
+                f.flush()
+                os.fsync(f.fileno())
 
+            os.replace(tmp_file, self.session_file)
             logger.debug(f"Session saved: {self.session_file}")
 
         except IOError as e:
             logger.error(f"Failed to save session: {e}")
+            tmp_file.unlink(missing_ok=True)
             raise
 
+        self._update_index({
+            'disease': database.disease_area,
+            'country': database.country,
+            'status': database.overall_status,
+            'completeness': database.completeness_score,
+            'updated_at': database.updated_at.isoformat()
+        })
+
+    def _update_index(self, entry: Optional[dict]) -> None:
+        """
+        Upsert (or remove, when entry is None) this session's summary
+        in the directory index.
+
+        The index lets list_sessions answer from one small file instead
+        of parsing every session in the directory. Updates are
+        best-effort: on failure the listing falls back to a full scan.
+
+        Args:
+            entry: Summary dict to store, or None to drop the session
+        """
+        index_file = self.session_dir / _INDEX_FILENAME
+
+        try:
+            try:
+                index = _read_session_file(index_file)
+            except (ValueError, IOError):
+                index = {}
+
+            if entry is None:
+                index.pop(self.session_id, None)
+            else:
+                index[self.session_id] = entry
+
+            tmp_file = index_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps_session(index))
+            os.replace(tmp_file, index_file)
+
+        except IOError as e:
+            logger.warning(f"Failed to update session index: {e}")
+
     def get_resume_point(self, database: PatientJourneyDatabase) -> int:
         """
         Determine which domain to resume from.
@@ -166,15 +359,15 @@ class SessionManager:
         Returns:
             Domain ID to resume from (1-7, or 8 if all complete)
         """
-        for domain_id in range(1, 8):
-            if domain_id not in database.domains:
-                return domain_id
+        completed = DomainStatus.COMPLETED
+        domains = database.domains
 
-            domain = database.domains[domain_id]
-            if domain.status not in [DomainStatus.COMPLETED]:
+        for domain_id in _DOMAIN_IDS:
+            domain = domains.get(domain_id)
+            if domain is None or domain.status is not completed:
                 return domain_id
 
-        return 8  # All complete
+        return _ALL_COMPLETE
 
     def get_session_status(self) -> Optional[dict]:
         """
@@ -187,8 +380,7 @@ class SessionManager:
             return None
 
         try:
-            with open(self.session_file, 'r') as f:
-                data = json.load(f)
+            data = _project_status(self.session_file)
 
             return {
                 'session_id': self.session_id,
@@ -199,13 +391,10 @@ class SessionManager:
                 'completeness': data.get('completeness_score', 0),
                 'created_at': data.get('created_at'),
                 'updated_at': data.get('updated_at'),
-                'domains_completed': sum(
-                    1 for d in data.get('domains', {}).values()
-                    if d.get('status') == 'completed'
-                )
+                'domains_completed': data.get('domains_completed', 0)
             }
 
-        except (json.JSONDecodeError, IOError):
+        except (ValueError, IOError):
             return None
 
     def delete_session(self) -> bool:
@@ -217,6 +406,7 @@ class SessionManager:
         """
         if self.session_file.exists():
             self.session_file.unlink()
+            self._update_index(None)
             logger.info(f"Deleted session: {self.session_id}")
             return True
         return False
@@ -234,7 +424,6 @@ class SessionManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = self.session_dir / f"{self.session_id}_backup_{timestamp}.json"
 
-        import shutil
         shutil.copy2(self.session_file, backup_file)
 
         logger.info(f"Created session backup: {backup_file}")
@@ -257,24 +446,61 @@ def list_sessions(session_dir: str = "data/sessions") -> list[dict]:
     if not session_path.exists():
         return sessions
 
-    for session_file in session_path.glob("*_session.json"):
-        try:
-            with open(session_file, 'r') as f:
-                data = json.load(f)
+    session_files = list(session_path.glob("*_session.json"))
 
-            sessions.append({
-                'session_id': session_file.stem.replace('_session', ''),
-                'disease': data.get('disease_area'),
-                'country': data.get('country'),
-                'status': data.get('overall_status'),
-                'completeness': data.get('completeness_score', 0),
-                'updated_at': data.get('updated_at')
-            })
-
-        except (json.JSONDecodeError, IOError):
-            continue
+    # Serve from the directory index when it covers every session file;
+    # sessions written by older versions force the full scan below
+    index_file = session_path / _INDEX_FILENAME
+    if index_file.exists():
+        try:
+            index = _read_session_file(index_file)
+            session_ids = {f.stem.replace('_session', '') for f in session_files}
+            if session_ids <= set(index):
+                sessions = [
+                    {'session_id': session_id, **index[session_id]}
+                    for session_id in session_ids
+                ]
+                sessions.sort(key=lambda x: x.get('updated_at', ''), reverse=True)
+                return sessions
+        except (ValueError, IOError):
+            pass
+
+    # Full scan fallback: overlap the blocking per-file reads once the
+    # directory is big enough for thread dispatch to pay for itself
+    if len(session_files) > 8:
+        with ThreadPoolExecutor(max_workers=min(32, len(session_files))) as executor:
+            summaries = list(executor.map(_summarize_session, session_files))
+    else:
+        summaries = [_summarize_session(f) for f in session_files]
+
+    sessions = [summary for summary in summaries if summary is not None]
 
     # Sort by update time (most recent first)
     sessions.sort(key=lambda x: x.get('updated_at', ''), reverse=True)
 
     return sessions
+
+
+def _summarize_session(session_file: Path) -> Optional[dict]:
+    """
+    Project the listing fields from one session file.
+
+    Args:
+        session_file: Path to a session JSON file
+
+    Returns:
+        Summary dict, or None for unreadable/corrupt files
+    """
+    try:
+        data = _project_status(session_file)
+    except (ValueError, IOError):
+        return None
+
+    return {
+        'session_id': session_file.stem.replace('_session', ''),
+        'disease': data.get('disease_area'),
+        'country': data.get('country'),
+        'status': data.get('overall_status'),
+        'completeness': data.get('completeness_score', 0),
+        'updated_at': data.get('updated_at')
+    }
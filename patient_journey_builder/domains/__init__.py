@@ -3,18 +3,36 @@ Domain definitions for the 7 patient journey research domains.
 """
 
 from .base_domain import BaseDomain, BASE_SYNTHESIS_PROMPT
-from .domain_implementations import (
-    EpidemiologyDomain,
-    HealthcareFinancesDomain,
-    CompetitiveLandscapeDomain,
-    ClinicalPathwaysDomain,
-    PatientExperienceDomain,
-    SegmentationDomain,
-    StakeholdersDomain,
-    DOMAINS,
-    get_domain,
-    get_all_domains,
-)
+
+# Names served lazily from domain_implementations; its class bodies
+# allocate every query tuple, schema and multi-KB prompt, so the parse
+# is deferred until a domain is actually referenced (PEP 562)
+_IMPLEMENTATION_EXPORTS = frozenset({
+    "EpidemiologyDomain",
+    "HealthcareFinancesDomain",
+    "CompetitiveLandscapeDomain",
+    "ClinicalPathwaysDomain",
+    "PatientExperienceDomain",
+    "SegmentationDomain",
+    "StakeholdersDomain",
+    "get_domain",
+    "get_all_domains",
+})
+
+
+def __getattr__(name: str):
+    """Resolve domain implementations lazily so package import stays cheap."""
+    if name in _IMPLEMENTATION_EXPORTS:
+        from . import domain_implementations
+
+        value = getattr(domain_implementations, name)
+        globals()[name] = value
+        return value
+    if name == "DOMAINS":
+        from .domain_implementations import get_all_domains
+
+        return get_all_domains()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "BaseDomain",
@@ -2,91 +2,119 @@
 Base domain class for research domains.
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
-from ..models import DomainData, DataTable
+import functools
+import json
+import re
+import string
+
+from abc import ABC
+from datetime import datetime
+from typing import ClassVar, Dict, FrozenSet, List, Mapping, Optional, Any, Sequence, Tuple
+from ..models import DomainData, DataTable, DomainStatus
+
+# Placeholder names generate_search_queries can substitute
+_KNOWN_QUERY_FIELDS = frozenset({"disease", "country", "major_city"})
 
 
 class BaseDomain(ABC):
     """
     Abstract base class for domain research sessions.
 
-    Each domain (1-7) should inherit from this class and implement
-    the required abstract methods to define:
-    - Search queries for the domain
+    Each domain (1-7) should inherit from this class and declare the
+    class attributes below to define:
+    - Search queries for the domain (templates may include {disease},
+      {country} and {major_city} placeholders)
     - Table schemas for data collection
     - Synthesis prompt for Claude
     - Validation criteria
+
+    The per-domain data are immutable module constants, so they are
+    exposed as plain class attributes rather than properties; reads
+    are direct attribute lookups with no descriptor-call overhead.
     """
 
-    domain_id: int
-    domain_name: str
+    __slots__ = ()
 
-    @property
-    @abstractmethod
-    def search_queries(self) -> List[str]:
-        """
-        Return list of search query templates for this domain.
+    domain_id: ClassVar[int]
+    domain_name: ClassVar[str]
 
-        Templates can include placeholders:
-        - {disease}: Disease/condition name
-        - {country}: Target country
-        - {major_city}: Major city in the country
+    # Search query templates for this domain
+    search_queries: ClassVar[Sequence[str]]
 
-        Returns:
-            List of query template strings
-        """
-        pass
+    # Table name -> column headers
+    table_schemas: ClassVar[Mapping[str, Sequence[str]]]
 
-    @property
-    @abstractmethod
-    def table_schemas(self) -> Dict[str, List[str]]:
-        """
-        Return table schemas for this domain.
+    # Required table names that must be populated
+    required_tables: ClassVar[Sequence[str]]
 
-        Returns:
-            Dictionary mapping table name -> list of column headers
-        """
-        pass
+    # Synthesis prompt template for Claude
+    synthesis_prompt: ClassVar[str]
 
-    @property
-    @abstractmethod
-    def required_tables(self) -> List[str]:
-        """
-        Return list of required table names that must be populated.
-
-        Returns:
-            List of table names
-        """
-        pass
+    # Table name -> critical field values that should be present;
+    # override in subclasses for domain-specific validation
+    critical_fields: ClassVar[Mapping[str, Sequence[str]]] = {}
 
-    @property
-    def critical_fields(self) -> Dict[str, List[str]]:
-        """
-        Return critical fields that should be present in tables.
-
-        Override in subclasses for domain-specific validation.
+    # Derived at class-definition time by __init_subclass__
+    _QUERY_PLACEHOLDERS: ClassVar[FrozenSet[str]] = frozenset()
+    _COMPILED_QUERIES: ClassVar[Optional[Tuple[tuple, ...]]] = None
 
-        Returns:
-            Dictionary mapping table name -> list of critical field values
+    def __init_subclass__(cls, **kwargs):
         """
-        return {}
-
-    @property
-    @abstractmethod
-    def synthesis_prompt(self) -> str:
+        Scan search query templates once at class definition.
+
+        Records which placeholder names each domain's templates use
+        ({disease}, {country}, {major_city}, ...) so renderers know up
+        front which substitutions apply instead of re-parsing templates
+        or guarding every format call with a KeyError handler. Templates
+        that only use plain fields are also pre-parsed into
+        (literal, field) fragment tuples, so rendering is straight
+        concatenation instead of a str.format reparse per call.
+
+        Also validates that every required table has a schema, so a
+        mismatched declaration fails at import rather than surfacing
+        as a permanent "Missing table" gap at validation time.
         """
-        Return the synthesis prompt template for Claude.
+        super().__init_subclass__(**kwargs)
+
+        schemas = cls.__dict__.get("table_schemas")
+        required = cls.__dict__.get("required_tables")
+        if schemas is not None and required is not None:
+            missing = [name for name in required if name not in schemas]
+            if missing:
+                raise ValueError(
+                    f"{cls.__name__}: required tables have no schema: "
+                    f"{missing}"
+                )
 
-        The prompt should instruct Claude on:
-        - What data to extract
-        - Output format (JSON structure)
-        - How to handle missing data
-
-        Returns:
-            Prompt template string
-        """
-        pass
+        templates = cls.__dict__.get("search_queries")
+        if templates is None:
+            return
+
+        formatter = string.Formatter()
+        all_fields: set = set()
+        compiled: Optional[List[tuple]] = []
+        for template in templates:
+            parsed = tuple(formatter.parse(template))
+            all_fields.update(
+                field_name for _, field_name, _, _ in parsed if field_name
+            )
+
+            if compiled is not None and all(
+                not spec and conversion is None
+                for _, field_name, spec, conversion in parsed
+                if field_name is not None
+            ):
+                compiled.append(tuple(
+                    (literal, field_name)
+                    for literal, field_name, _, _ in parsed
+                ))
+            else:
+                # A template needs full format() semantics (format
+                # spec or conversion); disable the compiled fast path
+                compiled = None
+
+        cls._QUERY_PLACEHOLDERS = frozenset(all_fields)
+        cls._COMPILED_QUERIES = tuple(compiled) if compiled is not None else None
 
     def generate_search_queries(
         self,
@@ -105,6 +133,40 @@ class BaseDomain(ABC):
         Returns:
             List of formatted search queries
         """
+        return list(self._formatted_queries(disease, country, major_city))
+
+    @functools.lru_cache(maxsize=64)
+    def _formatted_queries(
+        self,
+        disease: str,
+        country: str,
+        major_city: str
+    ) -> tuple:
+        """
+        Format query templates, memoized per (disease, country, city).
+
+        Domain instances are module-level singletons, so the cache is
+        effectively keyed by (domain, disease, country, city). Returns
+        a tuple so cached values cannot be mutated by callers.
+        """
+        compiled = self._COMPILED_QUERIES
+        if compiled is not None and self._QUERY_PLACEHOLDERS <= _KNOWN_QUERY_FIELDS:
+            # All placeholders are known and the templates were
+            # pre-parsed at class definition, so rendering is plain
+            # concatenation with no format() reparse or KeyError guard
+            values = {
+                "disease": disease,
+                "country": country,
+                "major_city": major_city,
+            }
+            return tuple(
+                "".join(
+                    literal if field is None else literal + values[field]
+                    for literal, field in fragments
+                )
+                for fragments in compiled
+            )
+
         queries = []
         for query_template in self.search_queries:
             try:
@@ -117,7 +179,7 @@ class BaseDomain(ABC):
             except KeyError:
                 # Template has unrecognized placeholder, use as-is
                 queries.append(query_template)
-        return queries
+        return tuple(queries)
 
     def get_synthesis_prompt(
         self,
@@ -134,13 +196,58 @@ class BaseDomain(ABC):
         Returns:
             Formatted prompt string
         """
-        import json
-        return self.synthesis_prompt.format(
+        return (
+            self.get_static_prompt_prefix(disease, country)
+            + self.get_domain_specific_suffix()
+        )
+
+    @functools.lru_cache(maxsize=16)
+    def get_static_prompt_prefix(
+        self,
+        disease: str,
+        country: str
+    ) -> str:
+        """
+        Get the formatted prompt prefix shared by all domains.
+
+        Identical for every domain in a run (same disease/country), so
+        the synthesizer can send it as a cacheable system block.
+
+        Args:
+            disease: Disease/condition name
+            country: Target country
+
+        Returns:
+            Formatted prefix string
+        """
+        return STATIC_SYNTHESIS_PRELUDE.format(
             disease=disease,
-            country=country,
-            table_schemas=json.dumps(self.table_schemas, indent=2)
+            country=country
         )
 
+    @functools.lru_cache(maxsize=16)
+    def get_domain_specific_suffix(self) -> str:
+        """
+        Get the domain-specific portion of the synthesis prompt.
+
+        Contains the table schemas and domain instructions; varies per
+        domain and is sent uncached after the static prefix. Memoized:
+        the template substitution and schema dump only depend on the
+        domain itself, and a stable string also keeps the full prompt
+        byte-identical across retries.
+
+        Returns:
+            Formatted suffix string
+        """
+        suffix_template = self.synthesis_prompt[len(STATIC_SYNTHESIS_PRELUDE):]
+        return suffix_template.format(table_schemas=self._table_schemas_json())
+
+    @functools.lru_cache(maxsize=16)
+    def _table_schemas_json(self) -> str:
+        """JSON rendering of table_schemas, serialized once per domain."""
+        # dict() because json.dumps rejects the read-only mapping proxy
+        return json.dumps(dict(self.table_schemas), indent=2)
+
     def validate_completeness(
         self,
         data: DomainData
@@ -164,22 +271,43 @@ class BaseDomain(ABC):
             elif len(table.rows) < 2:
                 gaps.append(f"Insufficient data in {table_name}: only {len(table.rows)} rows")
 
-        # Check critical fields
+        # Check critical fields: stringify and lowercase the rows once
+        # per table, then find all fields in a single pass with one
+        # precompiled regex instead of a substring scan per field
+        patterns = self._critical_field_patterns()
         for table_name, fields in self.critical_fields.items():
             table = data.get_table(table_name)
             if not table:
                 continue
 
+            haystack = '\n'.join(str(row) for row in table.rows).lower()
+            found = set(patterns[table_name].findall(haystack))
             for field in fields:
-                has_field = any(
-                    field.lower() in str(row).lower()
-                    for row in table.rows
-                )
-                if not has_field:
+                if field.lower() not in found:
                     gaps.append(f"Missing critical data '{field}' in {table_name}")
 
         return len(gaps) == 0, gaps
 
+    @functools.lru_cache(maxsize=16)
+    def _critical_field_patterns(self) -> Dict[str, "re.Pattern"]:
+        """
+        Compile one field-matching regex per critical table.
+
+        Each pattern ORs the table's critical field names inside a
+        lookahead, so a single findall pass reports every field present
+        — including overlapping matches like 'male' inside 'female',
+        matching the semantics of the old per-field substring checks.
+        Compiled once per domain; instances are singletons.
+        """
+        return {
+            table_name: re.compile(
+                "(?=(" + "|".join(
+                    re.escape(field.lower()) for field in fields
+                ) + "))"
+            )
+            for table_name, fields in self.critical_fields.items()
+        }
+
     def create_domain_data(self) -> DomainData:
         """
         Create an initialized DomainData object for this domain.
@@ -187,9 +315,6 @@ class BaseDomain(ABC):
         Returns:
             New DomainData instance
         """
-        from ..models import DomainStatus
-        from datetime import datetime
-
         return DomainData(
             domain_id=self.domain_id,
             domain_name=self.domain_name,
@@ -198,8 +323,10 @@ class BaseDomain(ABC):
         )
 
 
-# Base synthesis prompt template used by all domains
-BASE_SYNTHESIS_PROMPT = """
+# Static synthesis prelude shared by all domains. Kept free of
+# per-domain content so it can be sent as a cacheable system block
+# (Anthropic prompt caching) and reused across all 7 domain calls.
+STATIC_SYNTHESIS_PRELUDE = """
 You are a pharmaceutical market research analyst conducting research on {disease} in {country}.
 
 ## TASK
@@ -235,9 +362,6 @@ Return your analysis as a JSON object with the following structure:
 }}
 ```
 
-## TABLES TO POPULATE
-{table_schemas}
-
 ## IMPORTANT GUIDELINES
 - Use "NOT_FOUND" for data that cannot be located
 - Cross-validate key statistics across multiple sources when possible
@@ -246,3 +370,12 @@ Return your analysis as a JSON object with the following structure:
 - Prioritize recent data (last 5 years)
 - Cite sources for each data point where possible
 """
+
+# Per-domain table listing, appended after the static prelude
+TABLE_SECTION_TEMPLATE = """
+## TABLES TO POPULATE
+{table_schemas}
+"""
+
+# Base synthesis prompt template used by all domains
+BASE_SYNTHESIS_PROMPT = STATIC_SYNTHESIS_PRELUDE + TABLE_SECTION_TEMPLATE
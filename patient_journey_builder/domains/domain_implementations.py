@@ -1,522 +1,606 @@
 """
 Domain implementations for the 7 patient journey research domains.
+
+Queries, schemas and prompts are pure constants, so they are built once
+at import time; each domain class exposes the shared objects as plain
+class attributes, so access is a direct attribute lookup with no
+property-call overhead.
 """
 
-from typing import List, Dict
+import sys
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Sequence, Tuple, Type
+
 from .base_domain import BaseDomain, BASE_SYNTHESIS_PROMPT
 
 
+def _freeze_queries(*templates: str) -> Tuple[str, ...]:
+    """
+    Intern search query templates into a shared tuple.
+
+    Any template that appears verbatim in more than one domain
+    collapses to a single string object, and interned templates hash
+    once for the memoized query-formatting caches keyed on them.
+    """
+    return tuple(sys.intern(template) for template in templates)
+
+
+@lru_cache(maxsize=None)
+def _columns(*names: str) -> Tuple[str, ...]:
+    """
+    Build a tuple of interned column names, deduplicated by content.
+
+    Memoized on the name sequence, so schemas that declare the same
+    column list (several domains share e.g. a trailing
+    Source/Year/Notes shape) get back the same tuple object rather
+    than a fresh allocation per class.
+    """
+    return tuple(sys.intern(name) for name in names)
+
+
+def _freeze_schemas(schemas: Dict[str, List[str]]) -> Mapping[str, Tuple[str, ...]]:
+    """
+    Freeze schema column lists into tuples of interned strings.
+
+    Header names like "Source" and "Year" repeat across the seven
+    domains; interning collapses the duplicates to one string object
+    and lets downstream equality checks compare by pointer. Table
+    names are interned too since they recur as dict keys in parsed
+    results. The read-only mapping proxy and tuple values make the
+    shared schemas immutable end to end, so callers can hold them
+    without defensive copies.
+    """
+    return MappingProxyType({
+        sys.intern(table_name): _columns(*columns)
+        for table_name, columns in schemas.items()
+    })
+
+
+def _build_prompt(title: str, focus: Tuple[str, ...], trailer: str) -> str:
+    """
+    Assemble a domain synthesis prompt from its focus points.
+
+    Called once per domain at import. Sharing the heading and numbered
+    list shape keeps the seven prompts structurally identical, so the
+    boilerplate cannot drift through copy-paste edits.
+    """
+    numbered = "\n".join(f"{i}. {line}" for i, line in enumerate(focus, 1))
+    return (
+        BASE_SYNTHESIS_PROMPT
+        + f"\n\n## DOMAIN-SPECIFIC INSTRUCTIONS: {title}\n\n"
+        + "Focus on extracting:\n"
+        + numbered
+        + f"\n\n{trailer}\n"
+    )
+
+
+# --- Domain 1: Epidemiology ---
+
+_EPI_QUERIES: Tuple[str, ...] = _freeze_queries(
+    "{disease} prevalence {country} epidemiology",
+    "{disease} incidence rate {country} registry",
+    "{disease} age distribution gender {country} demographics",
+    "{disease} quality of life DLQI {country}",
+    "{disease} depression anxiety psychiatric comorbidity",
+    "{disease} disease duration remission natural history",
+    "{disease} autoimmune comorbidity thyroid disease",
+    "{disease} work productivity absenteeism economic burden",
+    "{country} population statistics adults",
+    "{disease} angioedema prevalence",
+    "{disease} sleep disturbance insomnia",
+    "{country} population {major_city}",
+    "{disease} epidemiology Europe statistics",
+    "{disease} patient registry data {country}",
+    "{disease} disease burden quality of life",
+    "{disease} comorbidities metabolic syndrome",
+    "{disease} genetic factors hereditary",
+)
+
+_EPI_SCHEMAS: Mapping[str, Tuple[str, ...]] = _freeze_schemas({
+    "prevalence_incidence": [
+        "Metric", "Value", "95% CI", "Source", "Year", "Confidence"
+    ],
+    "estimated_patient_population": [
+        "Category", "Estimate", "Calculation", "Source"
+    ],
+    "demographics": [
+        "Category", "Value", "Source", "Year"
+    ],
+    "age_distribution": [
+        "Age Group", "Prevalence/%", "Notes", "Source"
+    ],
+    "comorbidities": [
+        "Condition", "Prevalence in Patients", "Relative Risk", "Source"
+    ],
+    "quality_of_life": [
+        "Measure", "Score/Impact", "Comparison", "Source"
+    ],
+    "disease_characteristics": [
+        "Characteristic", "Value", "Notes", "Source"
+    ],
+})
+
+_EPI_REQUIRED: Tuple[str, ...] = (
+    "prevalence_incidence", "demographics", "estimated_patient_population"
+)
+
+_EPI_CRITICAL: Dict[str, List[str]] = {
+    "prevalence_incidence": ["prevalence"],
+    "demographics": ["female", "male", "age"],
+}
+
+_EPI_PROMPT = _build_prompt(
+    "EPIDEMIOLOGY",
+    (
+        "Prevalence and incidence rates with confidence intervals",
+        "Patient population estimates (diagnosed and undiagnosed)",
+        "Demographic breakdowns (age, gender, geographic distribution)",
+        "Comorbidity patterns",
+        "Quality of life impact measures (DLQI, SF-36, etc.)",
+        "Disease characteristics (duration, severity, remission rates)",
+    ),
+    "For prevalence/incidence, prioritize:\n"
+    "- National registry data\n"
+    "- Published epidemiological studies\n"
+    "- Government health statistics",
+)
+
+
 class EpidemiologyDomain(BaseDomain):
     """Domain 1: Epidemiology research session."""
 
+    __slots__ = ()
+
     domain_id = 1
     domain_name = "Epidemiology"
 
-    @property
-    def search_queries(self) -> List[str]:
-        return [
-            "{disease} prevalence {country} epidemiology",
-            "{disease} incidence rate {country} registry",
-            "{disease} age distribution gender {country} demographics",
-            "{disease} quality of life DLQI {country}",
-            "{disease} depression anxiety psychiatric comorbidity",
-            "{disease} disease duration remission natural history",
-            "{disease} autoimmune comorbidity thyroid disease",
-            "{disease} work productivity absenteeism economic burden",
-            "{country} population statistics adults",
-            "{disease} angioedema prevalence",
-            "{disease} sleep disturbance insomnia",
-            "{country} population {major_city}",
-            "{disease} epidemiology Europe statistics",
-            "{disease} patient registry data {country}",
-            "{disease} disease burden quality of life",
-            "{disease} comorbidities metabolic syndrome",
-            "{disease} genetic factors hereditary",
-        ]
-
-    @property
-    def table_schemas(self) -> Dict[str, List[str]]:
-        return {
-            "prevalence_incidence": [
-                "Metric", "Value", "95% CI", "Source", "Year", "Confidence"
-            ],
-            "estimated_patient_population": [
-                "Category", "Estimate", "Calculation", "Source"
-            ],
-            "demographics": [
-                "Category", "Value", "Source", "Year"
-            ],
-            "age_distribution": [
-                "Age Group", "Prevalence/%", "Notes", "Source"
-            ],
-            "comorbidities": [
-                "Condition", "Prevalence in Patients", "Relative Risk", "Source"
-            ],
-            "quality_of_life": [
-                "Measure", "Score/Impact", "Comparison", "Source"
-            ],
-            "disease_characteristics": [
-                "Characteristic", "Value", "Notes", "Source"
-            ],
-        }
-
-    @property
-    def required_tables(self) -> List[str]:
-        return ["prevalence_incidence", "demographics", "estimated_patient_population"]
-
-    @property
-    def critical_fields(self) -> Dict[str, List[str]]:
-        return {
-            "prevalence_incidence": ["prevalence"],
-            "demographics": ["female", "male", "age"],
-        }
-
-    @property
-    def synthesis_prompt(self) -> str:
-        return BASE_SYNTHESIS_PROMPT + """
-
-## DOMAIN-SPECIFIC INSTRUCTIONS: EPIDEMIOLOGY
-
-Focus on extracting:
-1. Prevalence and incidence rates with confidence intervals
-2. Patient population estimates (diagnosed and undiagnosed)
-3. Demographic breakdowns (age, gender, geographic distribution)
-4. Comorbidity patterns
-5. Quality of life impact measures (DLQI, SF-36, etc.)
-6. Disease characteristics (duration, severity, remission rates)
-
-For prevalence/incidence, prioritize:
-- National registry data
-- Published epidemiological studies
-- Government health statistics
-"""
+    search_queries = _EPI_QUERIES
+    table_schemas = _EPI_SCHEMAS
+    required_tables = _EPI_REQUIRED
+    critical_fields = _EPI_CRITICAL
+    synthesis_prompt = _EPI_PROMPT
+
+
+# --- Domain 2: Healthcare Finances ---
+
+_FIN_QUERIES: Tuple[str, ...] = _freeze_queries(
+    "{disease} treatment cost {country} healthcare",
+    "{disease} economic burden direct costs {country}",
+    "{disease} biologic therapy cost reimbursement",
+    "{disease} healthcare utilization hospitalization",
+    "{country} healthcare system pharmaceutical reimbursement",
+    "{disease} cost effectiveness analysis {country}",
+    "{disease} indirect costs work productivity",
+    "{country} health insurance coverage dermatology",
+    "{disease} treatment guidelines {country} recommendations",
+    "{disease} drug pricing {country}",
+    "TLV {country} reimbursement decisions biologics",
+    "{disease} patient out-of-pocket costs",
+    "{country} healthcare expenditure dermatological",
+    "{disease} budget impact analysis",
+    "{disease} specialty pharmacy costs",
+)
+
+_FIN_SCHEMAS: Mapping[str, Tuple[str, ...]] = _freeze_schemas({
+    "healthcare_costs": [
+        "Cost Category", "Annual Cost", "Currency", "Source", "Year"
+    ],
+    "treatment_costs": [
+        "Treatment", "Annual Cost", "Reimbursement Status", "Source"
+    ],
+    "healthcare_utilization": [
+        "Service Type", "Annual Visits/Episodes", "Cost per Visit", "Source"
+    ],
+    "reimbursement_landscape": [
+        "Treatment", "Reimbursement Status", "Restrictions", "Source"
+    ],
+    "economic_burden": [
+        "Category", "Cost/Impact", "Notes", "Source"
+    ],
+})
+
+_FIN_REQUIRED: Tuple[str, ...] = (
+    "healthcare_costs", "treatment_costs", "reimbursement_landscape"
+)
+
+_FIN_PROMPT = _build_prompt(
+    "HEALTHCARE FINANCES",
+    (
+        "Direct medical costs (consultations, treatments, hospitalizations)",
+        "Treatment costs by therapy type",
+        "Reimbursement status of key treatments",
+        "Healthcare resource utilization patterns",
+        "Indirect costs (productivity loss, absenteeism)",
+        "Out-of-pocket patient expenses",
+    ),
+    "Note the currency for all cost data. Convert to local currency where possible.",
+)
 
 
 class HealthcareFinancesDomain(BaseDomain):
     """Domain 2: Healthcare Finances research session."""
 
+    __slots__ = ()
+
     domain_id = 2
     domain_name = "Healthcare Finances"
 
-    @property
-    def search_queries(self) -> List[str]:
-        return [
-            "{disease} treatment cost {country} healthcare",
-            "{disease} economic burden direct costs {country}",
-            "{disease} biologic therapy cost reimbursement",
-            "{disease} healthcare utilization hospitalization",
-            "{country} healthcare system pharmaceutical reimbursement",
-            "{disease} cost effectiveness analysis {country}",
-            "{disease} indirect costs work productivity",
-            "{country} health insurance coverage dermatology",
-            "{disease} treatment guidelines {country} recommendations",
-            "{disease} drug pricing {country}",
-            "TLV {country} reimbursement decisions biologics",
-            "{disease} patient out-of-pocket costs",
-            "{country} healthcare expenditure dermatological",
-            "{disease} budget impact analysis",
-            "{disease} specialty pharmacy costs",
-        ]
-
-    @property
-    def table_schemas(self) -> Dict[str, List[str]]:
-        return {
-            "healthcare_costs": [
-                "Cost Category", "Annual Cost", "Currency", "Source", "Year"
-            ],
-            "treatment_costs": [
-                "Treatment", "Annual Cost", "Reimbursement Status", "Source"
-            ],
-            "healthcare_utilization": [
-                "Service Type", "Annual Visits/Episodes", "Cost per Visit", "Source"
-            ],
-            "reimbursement_landscape": [
-                "Treatment", "Reimbursement Status", "Restrictions", "Source"
-            ],
-            "economic_burden": [
-                "Category", "Cost/Impact", "Notes", "Source"
-            ],
-        }
-
-    @property
-    def required_tables(self) -> List[str]:
-        return ["healthcare_costs", "treatment_costs", "reimbursement_landscape"]
-
-    @property
-    def synthesis_prompt(self) -> str:
-        return BASE_SYNTHESIS_PROMPT + """
-
-## DOMAIN-SPECIFIC INSTRUCTIONS: HEALTHCARE FINANCES
-
-Focus on extracting:
-1. Direct medical costs (consultations, treatments, hospitalizations)
-2. Treatment costs by therapy type
-3. Reimbursement status of key treatments
-4. Healthcare resource utilization patterns
-5. Indirect costs (productivity loss, absenteeism)
-6. Out-of-pocket patient expenses
-
-Note the currency for all cost data. Convert to local currency where possible.
-"""
+    search_queries = _FIN_QUERIES
+    table_schemas = _FIN_SCHEMAS
+    required_tables = _FIN_REQUIRED
+    synthesis_prompt = _FIN_PROMPT
+
+
+# --- Domain 3: Competitive Landscape ---
+
+_COMP_QUERIES: Tuple[str, ...] = _freeze_queries(
+    "{disease} treatment market share {country}",
+    "{disease} biologic therapy market {country}",
+    "{disease} approved treatments {country}",
+    "{disease} pipeline drugs clinical trials",
+    "{disease} omalizumab market share",
+    "{disease} JAK inhibitors market",
+    "{disease} treatment guidelines recommendations",
+    "{disease} emerging therapies development",
+    "{disease} biosimilars market entry",
+    "{disease} competitive analysis pharma",
+    "{disease} market forecast {country}",
+    "EMA approved {disease} treatments",
+    "{disease} prescription trends {country}",
+    "{disease} market access barriers",
+)
+
+_COMP_SCHEMAS: Mapping[str, Tuple[str, ...]] = _freeze_schemas({
+    "approved_treatments": [
+        "Drug Name", "Company", "Mechanism", "Approval Date", "Indication"
+    ],
+    "market_share": [
+        "Treatment", "Market Share %", "Revenue", "Year", "Source"
+    ],
+    "pipeline_drugs": [
+        "Drug Name", "Company", "Phase", "Mechanism", "Expected Approval"
+    ],
+    "treatment_positioning": [
+        "Treatment Line", "Recommended Treatments", "Guidelines Source"
+    ],
+    "competitive_dynamics": [
+        "Factor", "Current State", "Trend", "Source"
+    ],
+})
+
+_COMP_REQUIRED: Tuple[str, ...] = (
+    "approved_treatments", "market_share", "pipeline_drugs"
+)
+
+_COMP_PROMPT = _build_prompt(
+    "COMPETITIVE LANDSCAPE",
+    (
+        "Currently approved treatments with approval dates",
+        "Market share data by treatment",
+        "Pipeline drugs and development stages",
+        "Treatment guidelines and positioning",
+        "Key market trends and dynamics",
+        "Biosimilar/generic competition",
+    ),
+    "Include both approved and pipeline products. Note mechanism of action for all drugs.",
+)
 
 
 class CompetitiveLandscapeDomain(BaseDomain):
     """Domain 3: Competitive Landscape research session."""
 
+    __slots__ = ()
+
     domain_id = 3
     domain_name = "Competitive Landscape"
 
-    @property
-    def search_queries(self) -> List[str]:
-        return [
-            "{disease} treatment market share {country}",
-            "{disease} biologic therapy market {country}",
-            "{disease} approved treatments {country}",
-            "{disease} pipeline drugs clinical trials",
-            "{disease} omalizumab market share",
-            "{disease} JAK inhibitors market",
-            "{disease} treatment guidelines recommendations",
-            "{disease} emerging therapies development",
-            "{disease} biosimilars market entry",
-            "{disease} competitive analysis pharma",
-            "{disease} market forecast {country}",
-            "EMA approved {disease} treatments",
-            "{disease} prescription trends {country}",
-            "{disease} market access barriers",
-        ]
-
-    @property
-    def table_schemas(self) -> Dict[str, List[str]]:
-        return {
-            "approved_treatments": [
-                "Drug Name", "Company", "Mechanism", "Approval Date", "Indication"
-            ],
-            "market_share": [
-                "Treatment", "Market Share %", "Revenue", "Year", "Source"
-            ],
-            "pipeline_drugs": [
-                "Drug Name", "Company", "Phase", "Mechanism", "Expected Approval"
-            ],
-            "treatment_positioning": [
-                "Treatment Line", "Recommended Treatments", "Guidelines Source"
-            ],
-            "competitive_dynamics": [
-                "Factor", "Current State", "Trend", "Source"
-            ],
-        }
-
-    @property
-    def required_tables(self) -> List[str]:
-        return ["approved_treatments", "market_share", "pipeline_drugs"]
-
-    @property
-    def synthesis_prompt(self) -> str:
-        return BASE_SYNTHESIS_PROMPT + """
-
-## DOMAIN-SPECIFIC INSTRUCTIONS: COMPETITIVE LANDSCAPE
-
-Focus on extracting:
-1. Currently approved treatments with approval dates
-2. Market share data by treatment
-3. Pipeline drugs and development stages
-4. Treatment guidelines and positioning
-5. Key market trends and dynamics
-6. Biosimilar/generic competition
-
-Include both approved and pipeline products. Note mechanism of action for all drugs.
-"""
+    search_queries = _COMP_QUERIES
+    table_schemas = _COMP_SCHEMAS
+    required_tables = _COMP_REQUIRED
+    synthesis_prompt = _COMP_PROMPT
+
+
+# --- Domain 4: Clinical Pathways ---
+
+_PATH_QUERIES: Tuple[str, ...] = _freeze_queries(
+    "{disease} treatment algorithm {country}",
+    "{disease} clinical guidelines {country} dermatology",
+    "{disease} diagnosis criteria",
+    "{disease} referral pathway specialist",
+    "{disease} first line second line treatment",
+    "{disease} biologic eligibility criteria",
+    "{disease} treatment escalation guidelines",
+    "{disease} disease activity scoring",
+    "{disease} treatment response criteria",
+    "{disease} primary care management",
+    "{disease} specialist referral patterns",
+    "{disease} treatment duration guidelines",
+    "{disease} switching therapy guidelines",
+    "EAACI guidelines {disease}",
+    "{disease} step therapy protocol",
+)
+
+_PATH_SCHEMAS: Mapping[str, Tuple[str, ...]] = _freeze_schemas({
+    "treatment_algorithm": [
+        "Step", "Treatment", "Duration", "Response Criteria", "Source"
+    ],
+    "diagnostic_pathway": [
+        "Stage", "Assessment", "Criteria", "Referral Trigger"
+    ],
+    "treatment_lines": [
+        "Line", "Treatments", "Duration", "Response Rate", "Source"
+    ],
+    "referral_patterns": [
+        "From", "To", "Trigger", "Typical Wait Time", "Source"
+    ],
+    "response_criteria": [
+        "Measure", "Definition", "Target", "Source"
+    ],
+})
+
+_PATH_REQUIRED: Tuple[str, ...] = ("treatment_algorithm", "treatment_lines")
+
+_PATH_PROMPT = _build_prompt(
+    "CLINICAL PATHWAYS",
+    (
+        "Step-by-step treatment algorithms",
+        "First-line, second-line, third-line treatments",
+        "Diagnostic and assessment criteria",
+        "Referral patterns between care settings",
+        "Treatment duration and response criteria",
+        "Eligibility criteria for advanced therapies",
+    ),
+    "Reference specific clinical guidelines (national and international).",
+)
 
 
 class ClinicalPathwaysDomain(BaseDomain):
     """Domain 4: Clinical Pathways research session."""
 
+    __slots__ = ()
+
     domain_id = 4
     domain_name = "Clinical Pathways"
 
-    @property
-    def search_queries(self) -> List[str]:
-        return [
-            "{disease} treatment algorithm {country}",
-            "{disease} clinical guidelines {country} dermatology",
-            "{disease} diagnosis criteria",
-            "{disease} referral pathway specialist",
-            "{disease} first line second line treatment",
-            "{disease} biologic eligibility criteria",
-            "{disease} treatment escalation guidelines",
-            "{disease} disease activity scoring",
-            "{disease} treatment response criteria",
-            "{disease} primary care management",
-            "{disease} specialist referral patterns",
-            "{disease} treatment duration guidelines",
-            "{disease} switching therapy guidelines",
-            "EAACI guidelines {disease}",
-            "{disease} step therapy protocol",
-        ]
-
-    @property
-    def table_schemas(self) -> Dict[str, List[str]]:
-        return {
-            "treatment_algorithm": [
-                "Step", "Treatment", "Duration", "Response Criteria", "Source"
-            ],
-            "diagnostic_pathway": [
-                "Stage", "Assessment", "Criteria", "Referral Trigger"
-            ],
-            "treatment_lines": [
-                "Line", "Treatments", "Duration", "Response Rate", "Source"
-            ],
-            "referral_patterns": [
-                "From", "To", "Trigger", "Typical Wait Time", "Source"
-            ],
-            "response_criteria": [
-                "Measure", "Definition", "Target", "Source"
-            ],
-        }
-
-    @property
-    def required_tables(self) -> List[str]:
-        return ["treatment_algorithm", "treatment_lines"]
-
-    @property
-    def synthesis_prompt(self) -> str:
-        return BASE_SYNTHESIS_PROMPT + """
-
-## DOMAIN-SPECIFIC INSTRUCTIONS: CLINICAL PATHWAYS
-
-Focus on extracting:
-1. Step-by-step treatment algorithms
-2. First-line, second-line, third-line treatments
-3. Diagnostic and assessment criteria
-4. Referral patterns between care settings
-5. Treatment duration and response criteria
-6. Eligibility criteria for advanced therapies
-
-Reference specific clinical guidelines (national and international).
-"""
+    search_queries = _PATH_QUERIES
+    table_schemas = _PATH_SCHEMAS
+    required_tables = _PATH_REQUIRED
+    synthesis_prompt = _PATH_PROMPT
+
+
+# --- Domain 5: Patient Experience ---
+
+_EXP_QUERIES: Tuple[str, ...] = _freeze_queries(
+    "{disease} patient experience quality of life",
+    "{disease} patient survey satisfaction {country}",
+    "{disease} patient journey barriers",
+    "{disease} patient support programs {country}",
+    "{disease} patient associations {country}",
+    "{disease} patient unmet needs",
+    "{disease} treatment adherence barriers",
+    "{disease} patient education resources",
+    "{disease} diagnosis delay patient",
+    "{disease} emotional impact patients",
+    "{disease} patient preference treatment",
+    "{disease} caregiver burden",
+    "{disease} patient advocacy groups {country}",
+    "{disease} shared decision making",
+    "{disease} patient reported outcomes",
+)
+
+_EXP_SCHEMAS: Mapping[str, Tuple[str, ...]] = _freeze_schemas({
+    "patient_journey_map": [
+        "Stage", "Experience", "Pain Points", "Duration", "Source"
+    ],
+    "unmet_needs": [
+        "Need Category", "Description", "Impact", "Source"
+    ],
+    "patient_support": [
+        "Program/Resource", "Provider", "Services", "Access"
+    ],
+    "treatment_preferences": [
+        "Factor", "Patient Priority", "Evidence", "Source"
+    ],
+    "barriers_to_care": [
+        "Barrier", "Impact", "Affected Population", "Source"
+    ],
+    "patient_organizations": [
+        "Organization", "Focus", "Services", "Website"
+    ],
+})
+
+_EXP_REQUIRED: Tuple[str, ...] = (
+    "patient_journey_map", "unmet_needs", "barriers_to_care"
+)
+
+_EXP_PROMPT = _build_prompt(
+    "PATIENT EXPERIENCE",
+    (
+        "Patient journey from symptoms to treatment",
+        "Key pain points and barriers to care",
+        "Unmet medical and non-medical needs",
+        "Patient support programs and resources",
+        "Treatment preferences and priorities",
+        "Patient organizations and advocacy groups",
+    ),
+    "Include patient voice/quotes where available from surveys or studies.",
+)
 
 
 class PatientExperienceDomain(BaseDomain):
     """Domain 5: Patient Experience research session."""
 
+    __slots__ = ()
+
     domain_id = 5
     domain_name = "Patient Experience"
 
-    @property
-    def search_queries(self) -> List[str]:
-        return [
-            "{disease} patient experience quality of life",
-            "{disease} patient survey satisfaction {country}",
-            "{disease} patient journey barriers",
-            "{disease} patient support programs {country}",
-            "{disease} patient associations {country}",
-            "{disease} patient unmet needs",
-            "{disease} treatment adherence barriers",
-            "{disease} patient education resources",
-            "{disease} diagnosis delay patient",
-            "{disease} emotional impact patients",
-            "{disease} patient preference treatment",
-            "{disease} caregiver burden",
-            "{disease} patient advocacy groups {country}",
-            "{disease} shared decision making",
-            "{disease} patient reported outcomes",
-        ]
-
-    @property
-    def table_schemas(self) -> Dict[str, List[str]]:
-        return {
-            "patient_journey_map": [
-                "Stage", "Experience", "Pain Points", "Duration", "Source"
-            ],
-            "unmet_needs": [
-                "Need Category", "Description", "Impact", "Source"
-            ],
-            "patient_support": [
-                "Program/Resource", "Provider", "Services", "Access"
-            ],
-            "treatment_preferences": [
-                "Factor", "Patient Priority", "Evidence", "Source"
-            ],
-            "barriers_to_care": [
-                "Barrier", "Impact", "Affected Population", "Source"
-            ],
-            "patient_organizations": [
-                "Organization", "Focus", "Services", "Website"
-            ],
-        }
-
-    @property
-    def required_tables(self) -> List[str]:
-        return ["patient_journey_map", "unmet_needs", "barriers_to_care"]
-
-    @property
-    def synthesis_prompt(self) -> str:
-        return BASE_SYNTHESIS_PROMPT + """
-
-## DOMAIN-SPECIFIC INSTRUCTIONS: PATIENT EXPERIENCE
-
-Focus on extracting:
-1. Patient journey from symptoms to treatment
-2. Key pain points and barriers to care
-3. Unmet medical and non-medical needs
-4. Patient support programs and resources
-5. Treatment preferences and priorities
-6. Patient organizations and advocacy groups
-
-Include patient voice/quotes where available from surveys or studies.
-"""
+    search_queries = _EXP_QUERIES
+    table_schemas = _EXP_SCHEMAS
+    required_tables = _EXP_REQUIRED
+    synthesis_prompt = _EXP_PROMPT
+
+
+# --- Domain 6: Patient Segmentation ---
+
+_SEG_QUERIES: Tuple[str, ...] = _freeze_queries(
+    "{disease} patient segmentation phenotypes",
+    "{disease} severity classification mild moderate severe",
+    "{disease} patient subgroups characteristics",
+    "{disease} treatment responders non-responders",
+    "{disease} biomarkers patient selection",
+    "{disease} disease subtypes classification",
+    "{disease} refractory patients definition",
+    "{disease} special populations elderly pediatric",
+    "{disease} comorbidity clusters",
+    "{disease} treatment-naive experienced",
+    "{disease} chronic acute classification",
+    "{disease} patient profiles personas",
+    "{disease} precision medicine biomarkers",
+)
+
+_SEG_SCHEMAS: Mapping[str, Tuple[str, ...]] = _freeze_schemas({
+    "patient_segments": [
+        "Segment", "Characteristics", "Size %", "Treatment Approach", "Source"
+    ],
+    "severity_distribution": [
+        "Severity Level", "Definition", "Prevalence %", "Source"
+    ],
+    "phenotypes": [
+        "Phenotype", "Characteristics", "Prevalence", "Treatment Response", "Source"
+    ],
+    "special_populations": [
+        "Population", "Considerations", "Size", "Treatment Modifications"
+    ],
+    "biomarkers": [
+        "Biomarker", "Use", "Predictive Value", "Source"
+    ],
+})
+
+_SEG_REQUIRED: Tuple[str, ...] = ("patient_segments", "severity_distribution")
+
+_SEG_PROMPT = _build_prompt(
+    "PATIENT SEGMENTATION",
+    (
+        "Patient segments by severity, phenotype, or characteristics",
+        "Severity distribution (mild, moderate, severe)",
+        "Treatment response profiles",
+        "Special populations (elderly, pediatric, pregnant)",
+        "Biomarkers for patient selection",
+        "Refractory/difficult-to-treat patient definitions",
+    ),
+    "Quantify segment sizes where possible (% of total population).",
+)
 
 
 class SegmentationDomain(BaseDomain):
     """Domain 6: Patient Segmentation research session."""
 
+    __slots__ = ()
+
     domain_id = 6
     domain_name = "Patient Segmentation"
 
-    @property
-    def search_queries(self) -> List[str]:
-        return [
-            "{disease} patient segmentation phenotypes",
-            "{disease} severity classification mild moderate severe",
-            "{disease} patient subgroups characteristics",
-            "{disease} treatment responders non-responders",
-            "{disease} biomarkers patient selection",
-            "{disease} disease subtypes classification",
-            "{disease} refractory patients definition",
-            "{disease} special populations elderly pediatric",
-            "{disease} comorbidity clusters",
-            "{disease} treatment-naive experienced",
-            "{disease} chronic acute classification",
-            "{disease} patient profiles personas",
-            "{disease} precision medicine biomarkers",
-        ]
-
-    @property
-    def table_schemas(self) -> Dict[str, List[str]]:
-        return {
-            "patient_segments": [
-                "Segment", "Characteristics", "Size %", "Treatment Approach", "Source"
-            ],
-            "severity_distribution": [
-                "Severity Level", "Definition", "Prevalence %", "Source"
-            ],
-            "phenotypes": [
-                "Phenotype", "Characteristics", "Prevalence", "Treatment Response", "Source"
-            ],
-            "special_populations": [
-                "Population", "Considerations", "Size", "Treatment Modifications"
-            ],
-            "biomarkers": [
-                "Biomarker", "Use", "Predictive Value", "Source"
-            ],
-        }
-
-    @property
-    def required_tables(self) -> List[str]:
-        return ["patient_segments", "severity_distribution"]
-
-    @property
-    def synthesis_prompt(self) -> str:
-        return BASE_SYNTHESIS_PROMPT + """
-
-## DOMAIN-SPECIFIC INSTRUCTIONS: PATIENT SEGMENTATION
-
-Focus on extracting:
-1. Patient segments by severity, phenotype, or characteristics
-2. Severity distribution (mild, moderate, severe)
-3. Treatment response profiles
-4. Special populations (elderly, pediatric, pregnant)
-5. Biomarkers for patient selection
-6. Refractory/difficult-to-treat patient definitions
-
-Quantify segment sizes where possible (% of total population).
-"""
+    search_queries = _SEG_QUERIES
+    table_schemas = _SEG_SCHEMAS
+    required_tables = _SEG_REQUIRED
+    synthesis_prompt = _SEG_PROMPT
+
+
+# --- Domain 7: Stakeholder Mapping ---
+
+_STAKE_QUERIES: Tuple[str, ...] = _freeze_queries(
+    "{disease} key opinion leaders {country}",
+    "{disease} dermatology specialists {country}",
+    "{disease} treatment centers excellence {country}",
+    "{disease} clinical research sites {country}",
+    "{disease} payer decision makers {country}",
+    "{disease} health technology assessment {country}",
+    "{disease} patient advocacy leaders {country}",
+    "{country} dermatology society association",
+    "{disease} medical education programs {country}",
+    "{disease} healthcare policy {country}",
+    "{disease} market access stakeholders",
+    "{country} pharmaceutical pricing committee",
+    "{disease} guideline authors {country}",
+    "{disease} registry researchers {country}",
+)
+
+_STAKE_SCHEMAS: Mapping[str, Tuple[str, ...]] = _freeze_schemas({
+    "key_opinion_leaders": [
+        "Name", "Institution", "Role/Expertise", "Influence Area"
+    ],
+    "treatment_centers": [
+        "Center Name", "Location", "Specialization", "Patient Volume"
+    ],
+    "payer_stakeholders": [
+        "Organization", "Role", "Decision Power", "Key Contacts"
+    ],
+    "professional_societies": [
+        "Organization", "Focus", "Key Activities", "Website"
+    ],
+    "patient_organizations": [
+        "Organization", "Focus", "Membership", "Key Activities"
+    ],
+    "regulatory_bodies": [
+        "Body", "Role", "Key Decisions", "Contact"
+    ],
+})
+
+_STAKE_REQUIRED: Tuple[str, ...] = (
+    "key_opinion_leaders", "treatment_centers", "payer_stakeholders"
+)
+
+_STAKE_PROMPT = _build_prompt(
+    "STAKEHOLDER MAPPING",
+    (
+        "Key opinion leaders in the disease area",
+        "Major treatment centers and their expertise",
+        "Payer and reimbursement decision makers",
+        "Professional societies and their influence",
+        "Patient organizations and advocates",
+        "Regulatory and HTA bodies",
+    ),
+    "Include names and institutions where publicly available. Note influence level.",
+)
 
 
 class StakeholdersDomain(BaseDomain):
     """Domain 7: Stakeholder Mapping research session."""
 
+    __slots__ = ()
+
     domain_id = 7
     domain_name = "Stakeholder Mapping"
 
-    @property
-    def search_queries(self) -> List[str]:
-        return [
-            "{disease} key opinion leaders {country}",
-            "{disease} dermatology specialists {country}",
-            "{disease} treatment centers excellence {country}",
-            "{disease} clinical research sites {country}",
-            "{disease} payer decision makers {country}",
-            "{disease} health technology assessment {country}",
-            "{disease} patient advocacy leaders {country}",
-            "{country} dermatology society association",
-            "{disease} medical education programs {country}",
-            "{disease} healthcare policy {country}",
-            "{disease} market access stakeholders",
-            "{country} pharmaceutical pricing committee",
-            "{disease} guideline authors {country}",
-            "{disease} registry researchers {country}",
-        ]
-
-    @property
-    def table_schemas(self) -> Dict[str, List[str]]:
-        return {
-            "key_opinion_leaders": [
-                "Name", "Institution", "Role/Expertise", "Influence Area"
-            ],
-            "treatment_centers": [
-                "Center Name", "Location", "Specialization", "Patient Volume"
-            ],
-            "payer_stakeholders": [
-                "Organization", "Role", "Decision Power", "Key Contacts"
-            ],
-            "professional_societies": [
-                "Organization", "Focus", "Key Activities", "Website"
-            ],
-            "patient_organizations": [
-                "Organization", "Focus", "Membership", "Key Activities"
-            ],
-            "regulatory_bodies": [
-                "Body", "Role", "Key Decisions", "Contact"
-            ],
-        }
-
-    @property
-    def required_tables(self) -> List[str]:
-        return ["key_opinion_leaders", "treatment_centers", "payer_stakeholders"]
-
-    @property
-    def synthesis_prompt(self) -> str:
-        return BASE_SYNTHESIS_PROMPT + """
-
-## DOMAIN-SPECIFIC INSTRUCTIONS: STAKEHOLDER MAPPING
-
-Focus on extracting:
-1. Key opinion leaders in the disease area
-2. Major treatment centers and their expertise
-3. Payer and reimbursement decision makers
-4. Professional societies and their influence
-5. Patient organizations and advocates
-6. Regulatory and HTA bodies
-
-Include names and institutions where publicly available. Note influence level.
-"""
-
-
-# Domain registry for easy access
-DOMAINS = {
-    1: EpidemiologyDomain(),
-    2: HealthcareFinancesDomain(),
-    3: CompetitiveLandscapeDomain(),
-    4: ClinicalPathwaysDomain(),
-    5: PatientExperienceDomain(),
-    6: SegmentationDomain(),
-    7: StakeholdersDomain(),
+    search_queries = _STAKE_QUERIES
+    table_schemas = _STAKE_SCHEMAS
+    required_tables = _STAKE_REQUIRED
+    synthesis_prompt = _STAKE_PROMPT
+
+
+# Domain class registry; instances are created lazily on first access
+# so importing this module does not pay for all seven constructions
+_DOMAIN_CLASSES: Dict[int, Type[BaseDomain]] = {
+    1: EpidemiologyDomain,
+    2: HealthcareFinancesDomain,
+    3: CompetitiveLandscapeDomain,
+    4: ClinicalPathwaysDomain,
+    5: PatientExperienceDomain,
+    6: SegmentationDomain,
+    7: StakeholdersDomain,
 }
 
 
+@lru_cache(maxsize=None)
 def get_domain(domain_id: int) -> BaseDomain:
     """
-    Get a domain instance by ID.
+    Get the shared domain instance for an ID.
+
+    Instantiated on first request and cached, so each domain remains a
+    process-wide singleton.
 
     Args:
         domain_id: Domain number (1-7)
@@ -527,16 +611,28 @@ def get_domain(domain_id: int) -> BaseDomain:
     Raises:
         ValueError: If domain_id is invalid
     """
-    if domain_id not in DOMAINS:
+    domain_class = _DOMAIN_CLASSES.get(domain_id)
+    if domain_class is None:
         raise ValueError(f"Invalid domain ID: {domain_id}. Must be 1-7.")
-    return DOMAINS[domain_id]
+    return domain_class()
 
 
+@lru_cache(maxsize=1)
 def get_all_domains() -> Dict[int, BaseDomain]:
     """
     Get all domain instances.
 
+    Returns the shared registry mapping; callers must treat it as
+    read-only (avoids re-copying on every orchestrator construction).
+
     Returns:
         Dictionary mapping domain ID to domain instance
     """
-    return DOMAINS.copy()
+    return {domain_id: get_domain(domain_id) for domain_id in _DOMAIN_CLASSES}
+
+
+def __getattr__(name: str):
+    """Keep the eager DOMAINS mapping importable without paying for it."""
+    if name == "DOMAINS":
+        return get_all_domains()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
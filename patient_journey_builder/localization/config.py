@@ -2,24 +2,54 @@
 Localization configuration for country-specific settings.
 """
 
+import string
+
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Try to import YAML support
+# Try to import YAML support; prefer the libyaml-backed loader, which
+# parses several times faster than the pure-Python SafeLoader
 try:
     import yaml
     YAML_SUPPORT = True
+    _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 except ImportError:
     YAML_SUPPORT = False
 
 
-@dataclass
+@lru_cache(maxsize=512)
+def _template_fragments(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Pre-parse a query template into (literal, field) fragments.
+
+    str.format reruns its mini-language parser on every call; parsing
+    once per distinct template lets localization render by plain
+    concatenation. Returns None when a template needs full format()
+    semantics (format spec or conversion), so callers can fall back.
+    """
+    fragments = []
+    for literal, field_name, spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (spec or conversion is not None):
+            return None
+        fragments.append((literal, field_name))
+    return tuple(fragments)
+
+
+@dataclass(frozen=True, slots=True)
 class CountryConfig:
-    """Configuration for a specific country."""
+    """
+    Configuration for a specific country.
+
+    Frozen with slots: configs are read-only lookup data shared across
+    the run, so instances skip the per-object __dict__ and attribute
+    reads take the slot-descriptor fast path.
+    """
 
     country_code: str
     country_name: str
@@ -30,19 +60,27 @@ class CountryConfig:
     medical_terms: Dict[str, str] = field(default_factory=dict)
 
     # Preferred data sources for this country
-    priority_sources: List[str] = field(default_factory=list)
+    priority_sources: Tuple[str, ...] = ()
 
     # Government health authority domains
-    health_authority_domains: List[str] = field(default_factory=list)
+    health_authority_domains: Tuple[str, ...] = ()
 
     # Population data
     population: Optional[int] = None
-    major_cities: List[str] = field(default_factory=list)
+    major_cities: Tuple[str, ...] = ()
 
     # Healthcare system specifics
     healthcare_system_type: str = ""
     currency: str = "USD"
 
+    def __post_init__(self):
+        # Normalize sequence fields to tuples so configs built from
+        # list literals or YAML are immutable end to end
+        object.__setattr__(self, 'priority_sources', tuple(self.priority_sources))
+        object.__setattr__(self, 'health_authority_domains',
+                           tuple(self.health_authority_domains))
+        object.__setattr__(self, 'major_cities', tuple(self.major_cities))
+
     def localize_query(self, query_template: str, disease: str) -> str:
         """
         Localize a search query for this country.
@@ -54,16 +92,30 @@ class CountryConfig:
         Returns:
             Localized query string
         """
-        query = query_template.format(
-            disease=disease,
-            country=self.country_name,
-            major_city=self.major_cities[0] if self.major_cities else ""
-        )
-
-        # Add local language variant if available
-        local_disease = self.medical_terms.get(disease.lower())
-        if local_disease and local_disease.lower() != disease.lower():
-            query = f"{query} OR {local_disease}"
+        values = {
+            'disease': disease,
+            'country': self.country_name,
+            'major_city': self.major_cities[0] if self.major_cities else ""
+        }
+
+        fragments = _template_fragments(query_template)
+        if fragments is not None:
+            query = "".join(
+                literal if field_name is None else literal + values[field_name]
+                for literal, field_name in fragments
+            )
+        else:
+            # Template uses format specs/conversions; take the slow path
+            query = query_template.format(**values)
+
+        # Add local language variant if available; countries without
+        # local terminology (e.g. the UK or generic fallbacks) skip the
+        # lowercase + lookup entirely
+        if self.medical_terms:
+            disease_lower = disease.lower()
+            local_disease = self.medical_terms.get(disease_lower)
+            if local_disease and local_disease.lower() != disease_lower:
+                query = f"{query} OR {local_disease}"
 
         return query
 
@@ -71,8 +123,9 @@ class CountryConfig:
 class LocalizationManager:
     """Manages country-specific configurations."""
 
-    # Built-in configurations for common markets
-    BUILTIN_CONFIGS = {
+    # Built-in configurations for common markets; read-only so every
+    # manager can share it without a defensive copy
+    BUILTIN_CONFIGS = MappingProxyType({
         'sweden': CountryConfig(
             country_code='SE',
             country_name='Sweden',
@@ -167,7 +220,7 @@ class LocalizationManager:
             healthcare_system_type='insurance-based',
             currency='EUR'
         ),
-    }
+    })
 
     def __init__(self, config_dir: Optional[str] = None):
         """
@@ -177,7 +230,9 @@ class LocalizationManager:
             config_dir: Optional directory for custom YAML configs
         """
         self.config_dir = Path(config_dir) if config_dir else None
-        self._configs: Dict[str, CountryConfig] = dict(self.BUILTIN_CONFIGS)
+        # Copy-on-write: share the built-in mapping until a custom
+        # config actually needs to be inserted
+        self._configs: Mapping[str, CountryConfig] = self.BUILTIN_CONFIGS
 
         # Load custom configs
         if self.config_dir and self.config_dir.exists():
@@ -192,27 +247,33 @@ class LocalizationManager:
         for yaml_file in self.config_dir.glob('*.yaml'):
             try:
                 with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=_YAML_LOADER)
                     config = CountryConfig(**data)
+                    if self._configs is self.BUILTIN_CONFIGS:
+                        self._configs = dict(self.BUILTIN_CONFIGS)
                     self._configs[config.country_name.lower()] = config
                     logger.info(f"Loaded custom config: {config.country_name}")
             except Exception as e:
                 logger.warning(f"Failed to load {yaml_file}: {e}")
 
+    @lru_cache(maxsize=64)
     def get_config(self, country: str) -> CountryConfig:
         """
         Get configuration for a country.
 
+        Memoized: _configs is immutable after __init__, and repeated
+        lookups for the same country (once per domain in a run) should
+        not re-probe or re-allocate generic fallback configs.
+
         Args:
             country: Country name
 
         Returns:
             CountryConfig for the country (or generic if not found)
         """
-        country_lower = country.lower()
-
-        if country_lower in self._configs:
-            return self._configs[country_lower]
+        config = self._configs.get(country.lower())
+        if config is not None:
+            return config
 
         # Return generic config
         return CountryConfig(
@@ -252,17 +313,32 @@ class LocalizationManager:
         Returns:
             List of localized queries
         """
-        config = self.get_config(country)
+        return list(self._localized_cached(tuple(base_queries), disease, country))
 
-        localized = []
-        for query in base_queries:
-            localized.append(config.localize_query(query, disease))
+    @lru_cache(maxsize=256)
+    def _localized_cached(
+        self,
+        base_queries: Tuple[str, ...],
+        disease: str,
+        country: str
+    ) -> Tuple[str, ...]:
+        """
+        Localize queries, memoized per (queries, disease, country).
 
-        # Add country-specific source queries
-        for source in config.priority_sources[:3]:
-            localized.append(f"site:{source} {disease}")
+        The same domain query list is localized repeatedly when several
+        domains run for one (disease, country) pair; caching skips the
+        re-formatting. Returns a tuple so cached values cannot be
+        mutated by callers.
+        """
+        config = self.get_config(country)
 
-        return localized
+        # Comprehension-built: sized allocations and no per-iteration
+        # append dispatch; country-specific source queries follow the
+        # localized base queries
+        return tuple(
+            [config.localize_query(query, disease) for query in base_queries]
+            + [f"site:{source} {disease}" for source in config.priority_sources[:3]]
+        )
 
     def list_countries(self) -> List[str]:
         """Get list of configured countries."""
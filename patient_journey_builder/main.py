@@ -2,19 +2,27 @@
 CLI entry point for Patient Journey Builder.
 """
 
-import click
 import sys
 from pathlib import Path
 
-from .config import Settings
-from .core import PatientJourneyOrchestrator, SessionManager, list_sessions
-from .output import export_to_json, export_to_markdown
-from .utils import configure_logging, ProgressLogger, CostTracker, estimate_run_cost
-from .localization import LocalizationManager
+_VERSION = '1.0.0'
+
+# Answer --version before importing click: the flag needs no option
+# parsing, and skipping the import keeps the cheapest invocation
+# near-instant
+if len(sys.argv) > 1 and sys.argv[1] == '--version':
+    print(f"{Path(sys.argv[0]).name}, version {_VERSION}")
+    sys.exit(0)
+
+import click
+
+# Heavy dependencies (pydantic settings, orchestrator, exporters) are
+# imported inside the command bodies, so lightweight invocations like
+# --help, status or countries don't pay for the full research stack
 
 
 @click.group()
-@click.version_option(version='1.0.0')
+@click.version_option(version=_VERSION)
 def cli():
     """
     Patient Journey Database Builder
@@ -63,6 +71,12 @@ def run(
         # Estimate costs without running
         pj-builder run -d "Psoriasis" -c "UK" --dry-run
     """
+    from .config import Settings
+    from .core import PatientJourneyOrchestrator
+    from .localization import LocalizationManager
+    from .output import export_to_json, export_to_markdown
+    from .utils import configure_logging, ProgressLogger, CostTracker
+
     # Configure logging
     configure_logging(
         log_level=log_level,
@@ -151,6 +165,8 @@ def run(
 @click.option('--session-dir', default='data/sessions', help='Session directory')
 def status(session_id: str, session_dir: str):
     """Check status of sessions."""
+    from .core import list_sessions
+
     if session_id:
         # Show specific session
         sessions = list_sessions(session_dir)
@@ -196,6 +212,8 @@ def status(session_id: str, session_dir: str):
 @click.option('--end-domain', '-e', default=7, type=int, help='End domain')
 def estimate(disease: str, country: str, start_domain: int, end_domain: int):
     """Estimate costs for a run."""
+    from .config import Settings
+
     try:
         config = Settings()
         _show_cost_estimate(disease, country, start_domain, end_domain, config)
@@ -208,9 +226,11 @@ def _show_cost_estimate(
     country: str,
     start_domain: int,
     end_domain: int,
-    config: Settings
+    config: "Settings"
 ):
     """Show cost estimation."""
+    from .utils import estimate_run_cost
+
     click.echo("\n🔮 Cost Estimation\n")
     click.echo(f"Disease: {disease}")
     click.echo(f"Country: {country}")
@@ -243,6 +263,8 @@ def _show_cost_estimate(
 @cli.command()
 def countries():
     """List supported countries with localization."""
+    from .localization import LocalizationManager
+
     localization = LocalizationManager()
     countries = localization.list_countries()
 
@@ -2,8 +2,8 @@
 Database models for Patient Journey data structures.
 """
 
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -93,12 +93,23 @@ class DomainData(BaseModel):
             return (self.completed_at - self.started_at).total_seconds()
         return None
 
+    # Lazily built name -> table index; rebuilt when the tables list
+    # is replaced or resized (it is only ever assigned wholesale)
+    _table_index: Optional[Tuple[List[DataTable], int, Dict[str, DataTable]]] = \
+        PrivateAttr(default=None)
+
     def get_table(self, name: str) -> Optional[DataTable]:
         """Get a table by name."""
-        for table in self.tables:
-            if table.table_name == name:
-                return table
-        return None
+        tables = self.tables
+        cached = self._table_index
+        if cached is None or cached[0] is not tables or cached[1] != len(tables):
+            index: Dict[str, DataTable] = {}
+            for table in tables:
+                # setdefault keeps the first match, like the old scan
+                index.setdefault(table.table_name, table)
+            cached = (tables, len(tables), index)
+            self._table_index = cached
+        return cached[2].get(name)
 
 
 class PatientJourneyDatabase(BaseModel):
@@ -136,16 +147,29 @@ class PatientJourneyDatabase(BaseModel):
         self.domains[domain_data.domain_id] = domain_data
         self.updated_at = datetime.now()
 
+    # Completeness memo keyed on (updated_at, domain count); mutation
+    # helpers bump updated_at, so a matching key means no status change
+    _completeness_cache: Optional[Tuple[datetime, int, float]] = \
+        PrivateAttr(default=None)
+
     def calculate_completeness(self) -> float:
         """Calculate overall completeness percentage."""
         if not self.domains:
             return 0.0
 
+        cached = self._completeness_cache
+        if (cached is not None
+                and cached[0] == self.updated_at
+                and cached[1] == len(self.domains)):
+            return cached[2]
+
         completed = sum(
             1 for d in self.domains.values()
-            if d.status == DomainStatus.COMPLETED
+            if d.status is DomainStatus.COMPLETED
         )
-        return (completed / self.total_domains) * 100
+        score = (completed / self.total_domains) * 100
+        self._completeness_cache = (self.updated_at, len(self.domains), score)
+        return score
 
     def get_all_tables(self) -> List[DataTable]:
         """Get all tables from all domains."""
@@ -4,13 +4,37 @@ JSON exporter for patient journey databases.
 
 import json
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 import logging
 
 from ..models import PatientJourneyDatabase
 
 logger = logging.getLogger(__name__)
 
+# Try to import orjson for faster serialization
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+
+def _write_json(output_path: Path, data: Any, indent: int) -> None:
+    """
+    Serialize data to a file, preferring orjson.
+
+    orjson serializes in C and returns bytes, skipping both the pure-
+    Python encoder and text-mode re-encoding; it only supports 2-space
+    indentation, so other indent widths use the stdlib encoder.
+    """
+    if ORJSON_SUPPORT and indent in (0, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        output_path.write_bytes(orjson.dumps(data, option=option))
+        return
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
+
 
 def export_to_json(
     database: PatientJourneyDatabase,
@@ -42,8 +66,7 @@ def export_to_json(
             domain_data.pop('raw_synthesis_output', None)
 
     # Write file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False, default=str)
+    _write_json(output_path, data, indent)
 
     logger.info(f"Exported JSON: {output_path}")
     return output_path
@@ -80,8 +103,7 @@ def export_tables_to_json(
         }
 
     # Write file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(tables_by_domain, f, indent=2, ensure_ascii=False)
+    _write_json(output_path, tables_by_domain, indent=2)
 
     logger.info(f"Exported tables JSON: {output_path}")
     return output_path
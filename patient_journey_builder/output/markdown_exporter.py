@@ -7,7 +7,7 @@ from typing import Union, List, Dict, Any
 from datetime import datetime
 import logging
 
-from ..models import PatientJourneyDatabase, DomainData, DataTable
+from ..models import PatientJourneyDatabase, DomainData, DataTable, DomainStatus
 
 logger = logging.getLogger(__name__)
 
@@ -29,56 +29,58 @@ def export_to_markdown(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines = []
-
-    # Header
-    lines.append(f"# Patient Journey Database: {database.disease_area}")
-    lines.append(f"")
-    lines.append(f"**Country:** {database.country}")
-    lines.append(f"**Generated:** {database.updated_at.strftime('%Y-%m-%d %H:%M')}")
-    lines.append(f"**Completeness:** {database.completeness_score:.1f}%")
-    if database.total_cost_usd > 0:
-        lines.append(f"**Estimated Cost:** ${database.total_cost_usd:.2f}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # Table of Contents
-    lines.append("## Table of Contents")
-    lines.append("")
-    for domain_id in sorted(database.domains.keys()):
-        domain = database.domains[domain_id]
-        anchor = domain.domain_name.lower().replace(' ', '-')
-        lines.append(f"- [{domain_id}. {domain.domain_name}](#{domain_id}-{anchor})")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # Each domain
-    for domain_id in sorted(database.domains.keys()):
-        domain = database.domains[domain_id]
-        lines.extend(_format_domain(domain))
+    # Stream section by section so peak memory stays at one domain's
+    # worth of lines rather than the whole document
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        lines = []
+
+        # Header
+        lines.append(f"# Patient Journey Database: {database.disease_area}")
+        lines.append(f"")
+        lines.append(f"**Country:** {database.country}")
+        lines.append(f"**Generated:** {database.updated_at.strftime('%Y-%m-%d %H:%M')}")
+        lines.append(f"**Completeness:** {database.completeness_score:.1f}%")
+        if database.total_cost_usd > 0:
+            lines.append(f"**Estimated Cost:** ${database.total_cost_usd:.2f}")
         lines.append("")
         lines.append("---")
         lines.append("")
 
-    # Data Gaps Summary
-    if database.data_gaps_summary:
-        lines.append("## Data Gaps Summary")
+        # Table of Contents
+        lines.append("## Table of Contents")
         lines.append("")
-        for gap in database.data_gaps_summary:
-            lines.append(f"- {gap}")
+        for domain_id in sorted(database.domains.keys()):
+            domain = database.domains[domain_id]
+            anchor = domain.domain_name.lower().replace(' ', '-')
+            lines.append(f"- [{domain_id}. {domain.domain_name}](#{domain_id}-{anchor})")
+        lines.append("")
+        lines.append("---")
         lines.append("")
+        _write_lines(f, lines)
 
-    # Write file
-    content = "\n".join(lines)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+        # Each domain
+        for domain_id in sorted(database.domains.keys()):
+            domain = database.domains[domain_id]
+            _write_lines(f, _format_domain(domain) + ["", "---", ""])
+
+        # Data Gaps Summary
+        if database.data_gaps_summary:
+            lines = ["## Data Gaps Summary", ""]
+            for gap in database.data_gaps_summary:
+                lines.append(f"- {gap}")
+            lines.append("")
+            _write_lines(f, lines)
 
     logger.info(f"Exported Markdown: {output_path}")
     return output_path
 
 
+def _write_lines(f, lines: List[str]) -> None:
+    """Write a block of lines to the handle, newline-terminated."""
+    f.write("\n".join(lines))
+    f.write("\n")
+
+
 def _format_domain(domain: DomainData) -> List[str]:
     """Format a domain section."""
     lines = []
@@ -202,48 +204,47 @@ def export_summary_markdown(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines = []
-
-    # Header
-    lines.append(f"# Patient Journey Summary: {database.disease_area} in {database.country}")
-    lines.append("")
-    lines.append(f"*Generated: {database.updated_at.strftime('%Y-%m-%d')}*")
-    lines.append("")
-
-    # Overview
-    lines.append("## Overview")
-    lines.append("")
-    lines.append(f"- **Disease:** {database.disease_area}")
-    lines.append(f"- **Country:** {database.country}")
-    lines.append(f"- **Completeness:** {database.completeness_score:.1f}%")
-    lines.append(f"- **Domains Completed:** {len([d for d in database.domains.values() if d.status.value == 'completed'])}/7")
-    lines.append("")
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        lines = []
 
-    # Domain summaries
-    lines.append("## Domain Summary")
-    lines.append("")
-
-    for domain_id in sorted(database.domains.keys()):
-        domain = database.domains[domain_id]
-        status_emoji = '✅' if domain.status.value == 'completed' else '❌'
-
-        lines.append(f"### {domain_id}. {domain.domain_name} {status_emoji}")
+        # Header
+        lines.append(f"# Patient Journey Summary: {database.disease_area} in {database.country}")
+        lines.append("")
+        lines.append(f"*Generated: {database.updated_at.strftime('%Y-%m-%d')}*")
         lines.append("")
-        lines.append(f"- Tables: {len(domain.tables)}")
-        lines.append(f"- Confidence: {domain.quality_summary.confidence_level}")
-
-        # List table names
-        if domain.tables:
-            lines.append(f"- Data collected:")
-            for table in domain.tables:
-                lines.append(f"  - {table.table_name.replace('_', ' ').title()} ({len(table.rows)} rows)")
 
+        # Overview
+        lines.append("## Overview")
+        lines.append("")
+        lines.append(f"- **Disease:** {database.disease_area}")
+        lines.append(f"- **Country:** {database.country}")
+        lines.append(f"- **Completeness:** {database.completeness_score:.1f}%")
+        lines.append(f"- **Domains Completed:** {len([d for d in database.domains.values() if d.status is DomainStatus.COMPLETED])}/7")
         lines.append("")
 
-    # Write file
-    content = "\n".join(lines)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+        # Domain summaries
+        lines.append("## Domain Summary")
+        lines.append("")
+        _write_lines(f, lines)
+
+        for domain_id in sorted(database.domains.keys()):
+            domain = database.domains[domain_id]
+            status_emoji = '✅' if domain.status is DomainStatus.COMPLETED else '❌'
+
+            lines = []
+            lines.append(f"### {domain_id}. {domain.domain_name} {status_emoji}")
+            lines.append("")
+            lines.append(f"- Tables: {len(domain.tables)}")
+            lines.append(f"- Confidence: {domain.quality_summary.confidence_level}")
+
+            # List table names
+            if domain.tables:
+                lines.append(f"- Data collected:")
+                for table in domain.tables:
+                    lines.append(f"  - {table.table_name.replace('_', ' ').title()} ({len(table.rows)} rows)")
+
+            lines.append("")
+            _write_lines(f, lines)
 
     logger.info(f"Exported summary Markdown: {output_path}")
     return output_path
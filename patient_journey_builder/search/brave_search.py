@@ -2,13 +2,14 @@
 Brave Search API client with caching and retry support.
 """
 
+import asyncio
 import httpx
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from ..models import SearchResult
-from ..utils import retry_search, handle_http_error, RateLimitError, AdaptiveRateLimiter
+from ..utils import retry_search, handle_http_error, AdaptiveRateLimiter
 from .search_cache import SearchCache
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,8 @@ class BraveSearchClient:
         api_key: str,
         cache: Optional[SearchCache] = None,
         rate_limiter: Optional[AdaptiveRateLimiter] = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        session: Optional[httpx.Client] = None
     ):
         """
         Initialize the Brave Search client.
@@ -39,11 +41,70 @@ class BraveSearchClient:
             cache: Optional cache instance
             rate_limiter: Optional rate limiter
             timeout: Request timeout in seconds
+            session: Optional shared httpx.Client; the caller owns its
+                lifecycle (keep-alive amortizes across components)
         """
         self.api_key = api_key
         self.cache = cache or SearchCache(enabled=False)
         self.rate_limiter = rate_limiter or AdaptiveRateLimiter(base_delay=1.0)
-        self.client = httpx.Client(timeout=timeout)
+        self.timeout = timeout
+        self._owns_client = session is None
+        self.client = session if session is not None else httpx.Client(timeout=timeout)
+        self._async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get (or lazily create) the async client for the running loop.
+
+        Keyed per event loop: parallel domains each drive their own
+        asyncio.run() loop in a worker thread, and httpx AsyncClients
+        are bound to the loop they were created under — sharing one
+        across loops corrupts in-flight requests.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(timeout=self.timeout)
+            self._async_clients[loop] = client
+        return client
+
+    def _build_request(
+        self,
+        query: str,
+        country: Optional[str],
+        count: int,
+        freshness: Optional[str]
+    ) -> Tuple[dict, dict]:
+        """
+        Build headers and query parameters for a search request.
+
+        Args:
+            query: Search query string
+            country: Optional country code
+            count: Number of results to return
+            freshness: Optional freshness filter
+
+        Returns:
+            Tuple of (headers, params) dicts
+        """
+        headers = {
+            "X-Subscription-Token": self.api_key,
+            "Accept": "application/json"
+        }
+
+        params = {
+            "q": query,
+            "count": min(count, 20),  # Brave max is 20
+            "search_lang": "en",
+            "text_decorations": False
+        }
+
+        if country:
+            params["country"] = country.upper()
+        if freshness:
+            params["freshness"] = freshness
+
+        return headers, params
 
     def search(
         self,
@@ -71,7 +132,9 @@ class BraveSearchClient:
         cached = self.cache.get(cache_key, cache_type="search")
         if cached:
             logger.debug(f"Cache hit for query: {query[:50]}...")
-            results = [SearchResult(**r) for r in cached]
+            # Cached entries are our own model_dump output, so skip
+            # re-validation when rehydrating
+            results = [SearchResult.model_construct(**r) for r in cached]
             return results, True
 
         # Execute search with retry
@@ -106,23 +169,7 @@ class BraveSearchClient:
         # Apply rate limiting
         self.rate_limiter.wait_sync()
 
-        headers = {
-            "X-Subscription-Token": self.api_key,
-            "Accept": "application/json"
-        }
-
-        params = {
-            "q": query,
-            "count": min(count, 20),  # Brave max is 20
-            "search_lang": "en",
-            "text_decorations": False
-        }
-
-        # Add optional parameters
-        if country:
-            params["country"] = country.upper()
-        if freshness:
-            params["freshness"] = freshness
+        headers, params = self._build_request(query, country, count, freshness)
 
         try:
             response = self.client.get(
@@ -131,18 +178,101 @@ class BraveSearchClient:
                 params=params
             )
 
+            self.rate_limiter.observe_response(response.headers, response.status_code)
+
             if response.status_code != 200:
                 handle_http_error(response)
 
-            self.rate_limiter.on_success()
             return self._parse_results(response.json())
 
         except httpx.TimeoutException:
             logger.warning(f"Search timeout for query: {query[:50]}...")
             raise
-        except Exception as e:
-            if isinstance(e, RateLimitError):
-                self.rate_limiter.on_rate_limit(e.retry_after)
+
+    async def search_async(
+        self,
+        query: str,
+        country: Optional[str] = None,
+        count: int = 10,
+        freshness: Optional[str] = None
+    ) -> tuple[List[SearchResult], bool]:
+        """
+        Execute a search query asynchronously.
+
+        Async counterpart to `search` for use when queries run
+        concurrently within an event loop.
+
+        Args:
+            query: Search query string
+            country: Optional country code (e.g., 'SE', 'DE', 'GB')
+            count: Number of results to return (max 20)
+            freshness: Optional freshness filter ('pd', 'pw', 'pm', 'py')
+
+        Returns:
+            Tuple of (list of SearchResult, was_cached boolean)
+        """
+        # Build cache key
+        cache_key = f"search:{query}:{country}:{count}"
+
+        # Check cache first
+        cached = self.cache.get(cache_key, cache_type="search")
+        if cached:
+            logger.debug(f"Cache hit for query: {query[:50]}...")
+            # Cached entries are our own model_dump output, so skip
+            # re-validation when rehydrating
+            results = [SearchResult.model_construct(**r) for r in cached]
+            return results, True
+
+        # Execute search with retry
+        start_time = time.time()
+        results = await self._execute_search_async(query, country, count, freshness)
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        # Cache results
+        if results:
+            self.cache.set(
+                cache_key,
+                [r.model_dump() for r in results],
+                cache_type="search"
+            )
+
+        logger.info(f"Search completed: {len(results)} results in {duration_ms}ms")
+        return results, False
+
+    @retry_search
+    async def _execute_search_async(
+        self,
+        query: str,
+        country: Optional[str],
+        count: int,
+        freshness: Optional[str]
+    ) -> List[SearchResult]:
+        """
+        Execute the actual search API call asynchronously.
+
+        Decorated with retry logic for transient failures.
+        """
+        # Apply rate limiting
+        await self.rate_limiter.wait()
+
+        headers, params = self._build_request(query, country, count, freshness)
+
+        try:
+            response = await self._get_async_client().get(
+                self.BASE_URL,
+                headers=headers,
+                params=params
+            )
+
+            self.rate_limiter.observe_response(response.headers, response.status_code)
+
+            if response.status_code != 200:
+                handle_http_error(response)
+
+            return self._parse_results(response.json())
+
+        except httpx.TimeoutException:
+            logger.warning(f"Search timeout for query: {query[:50]}...")
             raise
 
     def _parse_results(self, data: dict) -> List[SearchResult]:
@@ -212,9 +342,16 @@ class BraveSearchClient:
 
         return results
 
+    async def aclose(self) -> None:
+        """Close the async client bound to the running loop, if any."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
     def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client (if owned by this instance)."""
+        if self._owns_client:
+            self.client.close()
 
     def __enter__(self):
         return self
@@ -5,6 +5,7 @@ Search result cache with TTL support.
 import json
 import hashlib
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional
 import logging
@@ -17,14 +18,17 @@ class SearchCache:
     File-based cache for search results and fetched content.
 
     Supports TTL (time-to-live) for cache entries and
-    automatic cleanup of expired entries.
+    automatic cleanup of expired entries. A small in-memory
+    LRU layer sits in front of the files so repeated lookups
+    for the same key skip the hash + open + parse round trip.
     """
 
     def __init__(
         self,
         cache_dir: str = "data/cache",
         default_ttl_hours: int = 24 * 7,  # 1 week default
-        enabled: bool = True
+        enabled: bool = True,
+        memory_cache_size: int = 256
     ):
         """
         Initialize the cache.
@@ -33,11 +37,15 @@ class SearchCache:
             cache_dir: Directory to store cache files
             default_ttl_hours: Default TTL in hours
             enabled: Whether caching is enabled
+            memory_cache_size: Max entries held in the in-memory LRU layer
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.default_ttl = default_ttl_hours * 3600  # Convert to seconds
         self.enabled = enabled
+        self.memory_cache_size = memory_cache_size
+        # Maps (cache_type, key) -> (expires_at, data), most recent last
+        self._memory_cache: OrderedDict[tuple, tuple] = OrderedDict()
 
         # Create subdirectories for different cache types
         (self.cache_dir / "search").mkdir(exist_ok=True)
@@ -83,6 +91,17 @@ class SearchCache:
         if not self.enabled:
             return None
 
+        # Check in-memory LRU layer first
+        memory_key = (cache_type, key)
+        memory_entry = self._memory_cache.get(memory_key)
+        if memory_entry is not None:
+            expires_at, data = memory_entry
+            if expires_at >= time.time():
+                self._memory_cache.move_to_end(memory_key)
+                logger.debug(f"Memory cache hit for key: {key[:50]}...")
+                return data
+            del self._memory_cache[memory_key]
+
         cache_path = self._get_cache_path(key, cache_type)
 
         if not cache_path.exists():
@@ -99,12 +118,24 @@ class SearchCache:
                 return None
 
             logger.debug(f"Cache hit for key: {key[:50]}...")
-            return entry.get('data')
+            data = entry.get('data')
+            self._remember(memory_key, entry.get('expires_at', 0), data)
+            return data
 
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"Cache read error: {e}")
             return None
 
+    def _remember(self, memory_key: tuple, expires_at: float, data: Any) -> None:
+        """
+        Store an entry in the in-memory LRU layer, evicting the
+        least recently used entry when full.
+        """
+        self._memory_cache[memory_key] = (expires_at, data)
+        self._memory_cache.move_to_end(memory_key)
+        while len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
+
     def set(
         self,
         key: str,
@@ -138,6 +169,7 @@ class SearchCache:
         try:
             with open(cache_path, 'w') as f:
                 json.dump(entry, f)
+            self._remember((cache_type, key), entry['expires_at'], value)
             logger.debug(f"Cached value for key: {key[:50]}...")
         except IOError as e:
             logger.warning(f"Cache write error: {e}")
@@ -153,6 +185,8 @@ class SearchCache:
         Returns:
             True if entry was deleted
         """
+        self._memory_cache.pop((cache_type, key), None)
+
         cache_path = self._get_cache_path(key, cache_type)
 
         if cache_path.exists():
@@ -174,8 +208,11 @@ class SearchCache:
 
         if cache_type:
             cache_dirs = [self.cache_dir / cache_type]
+            for memory_key in [k for k in self._memory_cache if k[0] == cache_type]:
+                del self._memory_cache[memory_key]
         else:
             cache_dirs = [self.cache_dir / "search", self.cache_dir / "content"]
+            self._memory_cache.clear()
 
         for cache_dir in cache_dirs:
             if cache_dir.exists():
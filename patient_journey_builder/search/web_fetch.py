@@ -2,9 +2,10 @@
 Web content fetcher with HTML extraction and PDF support.
 """
 
+import asyncio
 import httpx
 import time
-from typing import Optional
+from typing import Dict, Optional
 from bs4 import BeautifulSoup
 import logging
 
@@ -53,7 +54,9 @@ class WebFetcher:
         rate_limiter: Optional[AdaptiveRateLimiter] = None,
         timeout: float = 30.0,
         max_content_length: int = 5_000_000,  # 5MB
-        enable_pdf: bool = True
+        enable_pdf: bool = True,
+        session: Optional[httpx.Client] = None,
+        max_concurrent_fetches: int = 8
     ):
         """
         Initialize the web fetcher.
@@ -64,17 +67,52 @@ class WebFetcher:
             timeout: Request timeout in seconds
             max_content_length: Maximum content size to download
             enable_pdf: Whether to enable PDF extraction
+            session: Optional shared httpx.Client; the caller owns its
+                lifecycle (keep-alive amortizes across components)
+            max_concurrent_fetches: Bound on in-flight fetches in
+                fetch_many; caps peak memory at roughly
+                max_concurrent_fetches * max_content_length
         """
         self.cache = cache or SearchCache(enabled=False)
         self.rate_limiter = rate_limiter or AdaptiveRateLimiter(base_delay=0.5)
         self.max_content_length = max_content_length
+        self.max_concurrent_fetches = max_concurrent_fetches
         self.enable_pdf = enable_pdf and PDF_SUPPORT
+        self.timeout = timeout
 
-        self.client = httpx.Client(
+        self._owns_client = session is None
+        self.client = session if session is not None else httpx.Client(
             timeout=timeout,
             follow_redirects=True,
             headers={"User-Agent": self.USER_AGENT}
         )
+        self._async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get (or lazily create) the async client for the running loop.
+
+        Keyed per event loop: parallel domains each drive their own
+        asyncio.run() loop in a worker thread, and httpx AsyncClients
+        are bound to the loop they were created under — sharing one
+        across loops corrupts in-flight requests.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": self.USER_AGENT},
+                # Keep connections alive so TCP/TLS handshakes amortize
+                # across the many fetches issued per domain
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=50
+                )
+            )
+            self._async_clients[loop] = client
+        return client
 
     def fetch(
         self,
@@ -137,50 +175,125 @@ class WebFetcher:
 
         try:
             response = self.client.get(url)
+            return self._process_response(response, url, max_chars)
 
-            if response.status_code != 200:
-                handle_http_error(response)
+        except httpx.TimeoutException:
+            logger.warning(f"Fetch timeout for URL: {url[:50]}...")
+            return FetchedContent(url=url, error="Request timeout")
+        except Exception as e:
+            logger.warning(f"Fetch error for {url[:50]}: {e}")
+            return FetchedContent(url=url, error=str(e))
 
-            self.rate_limiter.on_success()
+    async def fetch_async(
+        self,
+        url: str,
+        max_chars: int = 16000
+    ) -> FetchedContent:
+        """
+        Fetch and extract content from URL asynchronously.
 
-            # Check content type
-            content_type = response.headers.get('content-type', '').lower()
+        Async counterpart to `fetch` for use when fetches run
+        concurrently within an event loop.
 
-            # Check content length
-            content_length = int(response.headers.get('content-length', 0))
-            if content_length > self.max_content_length:
-                return FetchedContent(
-                    url=url,
-                    error=f"Content too large: {content_length} bytes"
-                )
+        Args:
+            url: URL to fetch
+            max_chars: Maximum characters to return
 
-            # Handle PDF
-            if 'application/pdf' in content_type:
-                if self.enable_pdf:
-                    content = self._extract_pdf(response.content, max_chars)
-                    return FetchedContent(
-                        url=url,
-                        content=content,
-                        content_type='application/pdf',
-                        truncated=len(content) >= max_chars
-                    )
-                else:
-                    return FetchedContent(
-                        url=url,
-                        error="PDF extraction not available"
-                    )
-
-            # Handle HTML/text
-            content = self._extract_html(response.text, max_chars)
-            truncated = len(content) >= max_chars
+        Returns:
+            FetchedContent object with extracted text
+        """
+        # Build cache key
+        cache_key = f"content:{url}"
 
+        # Check cache first
+        cached = self.cache.get(cache_key, cache_type="content")
+        if cached:
+            logger.debug(f"Cache hit for URL: {url[:50]}...")
             return FetchedContent(
                 url=url,
-                content=content,
-                content_type=content_type.split(';')[0],
-                truncated=truncated
+                content=cached.get('content'),
+                content_type=cached.get('content_type', 'text/html'),
+                fetch_time_ms=0,
+                truncated=cached.get('truncated', False)
+            )
+
+        # Fetch content
+        start_time = time.time()
+        result = await self._fetch_url_async(url, max_chars)
+        result.fetch_time_ms = int((time.time() - start_time) * 1000)
+
+        # Cache successful fetches
+        if result.success:
+            self.cache.set(
+                cache_key,
+                {
+                    'content': result.content,
+                    'content_type': result.content_type,
+                    'truncated': result.truncated
+                },
+                cache_type="content"
             )
 
+        return result
+
+    async def fetch_many(
+        self,
+        urls: list[str],
+        max_chars: int = 16000
+    ) -> list[FetchedContent]:
+        """
+        Fetch multiple URLs concurrently.
+
+        Dispatches all fetches with a single gather over the shared
+        connection pool; results come back in input order. In-flight
+        fetches are bounded by a semaphore so raw response bodies
+        (multi-MB for PDFs) do not all sit in memory at once — peak
+        RSS stays near max_concurrent_fetches * max_content_length
+        regardless of how many URLs are passed in.
+
+        Args:
+            urls: List of URLs to fetch
+            max_chars: Maximum characters per page
+
+        Returns:
+            List of FetchedContent objects (one per URL)
+        """
+        # Created per call: asyncio primitives bind to the running loop
+        semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+        async def bounded_fetch(url: str) -> FetchedContent:
+            async with semaphore:
+                return await self.fetch_async(url, max_chars)
+
+        fetched = await asyncio.gather(
+            *(bounded_fetch(url) for url in urls),
+            return_exceptions=True
+        )
+
+        results = []
+        for url, result in zip(urls, fetched):
+            if isinstance(result, Exception):
+                logger.warning(f"Fetch error for {url[:50]}: {result}")
+                results.append(FetchedContent(url=url, error=str(result)))
+            else:
+                results.append(result)
+
+        return results
+
+    @retry_fetch
+    async def _fetch_url_async(self, url: str, max_chars: int) -> FetchedContent:
+        """
+        Execute the actual fetch operation asynchronously.
+
+        Decorated with retry logic for transient failures.
+        """
+        # Apply rate limiting
+        await self.rate_limiter.wait()
+
+        try:
+            response = await self._get_async_client().get(url)
+            return self._process_response(response, url, max_chars)
+
         except httpx.TimeoutException:
             logger.warning(f"Fetch timeout for URL: {url[:50]}...")
             return FetchedContent(url=url, error="Request timeout")
@@ -188,6 +301,68 @@ class WebFetcher:
             logger.warning(f"Fetch error for {url[:50]}: {e}")
             return FetchedContent(url=url, error=str(e))
 
+    def _process_response(
+        self,
+        response: httpx.Response,
+        url: str,
+        max_chars: int
+    ) -> FetchedContent:
+        """
+        Extract content from an HTTP response.
+
+        Shared by the sync and async fetch paths.
+
+        Args:
+            response: The HTTP response
+            url: Source URL
+            max_chars: Maximum characters to return
+
+        Returns:
+            FetchedContent object with extracted text
+        """
+        self.rate_limiter.observe_response(response.headers, response.status_code)
+
+        if response.status_code != 200:
+            handle_http_error(response)
+
+        # Check content type
+        content_type = response.headers.get('content-type', '').lower()
+
+        # Check content length
+        content_length = int(response.headers.get('content-length', 0))
+        if content_length > self.max_content_length:
+            return FetchedContent(
+                url=url,
+                error=f"Content too large: {content_length} bytes"
+            )
+
+        # Handle PDF
+        if 'application/pdf' in content_type:
+            if self.enable_pdf:
+                content = self._extract_pdf(response.content, max_chars)
+                return FetchedContent(
+                    url=url,
+                    content=content,
+                    content_type='application/pdf',
+                    truncated=len(content) >= max_chars
+                )
+            else:
+                return FetchedContent(
+                    url=url,
+                    error="PDF extraction not available"
+                )
+
+        # Handle HTML/text
+        content = self._extract_html(response.text, max_chars)
+        truncated = len(content) >= max_chars
+
+        return FetchedContent(
+            url=url,
+            content=content,
+            content_type=content_type.split(';')[0],
+            truncated=truncated
+        )
+
     def _extract_html(self, html: str, max_chars: int) -> str:
         """
         Extract main text content from HTML.
@@ -311,9 +486,16 @@ class WebFetcher:
 
         return results
 
+    async def aclose(self) -> None:
+        """Close the async client bound to the running loop, if any."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
     def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client (if owned by this instance)."""
+        if self._owns_client:
+            self.client.close()
 
     def __enter__(self):
         return self
@@ -55,7 +55,8 @@ class ClaudeSynthesizer:
         page_contents: List[Optional[str]],
         required_tables: List[str],
         max_retries: int = 2,
-        existing_gaps: Optional[List[str]] = None
+        existing_gaps: Optional[List[str]] = None,
+        static_prefix: Optional[str] = None
     ) -> Tuple[ParseResult, Dict[str, Any]]:
         """
         Synthesize search results into structured domain data.
@@ -69,6 +70,8 @@ class ClaudeSynthesizer:
             required_tables: List of table names that must be populated
             max_retries: Number of retries if output has gaps
             existing_gaps: Known gaps to focus on (for retries)
+            static_prefix: Optional prompt prefix shared across domains,
+                sent as a cacheable system block (Anthropic prompt caching)
 
         Returns:
             Tuple of (ParseResult, quality_metrics dict)
@@ -103,7 +106,7 @@ If data cannot be found, mark as "NOT_FOUND" with explanation.
 
         for attempt in range(max_retries + 1):
             try:
-                result, metrics = self._execute_synthesis(prompt, context)
+                result, metrics = self._execute_synthesis(prompt, context, static_prefix)
 
                 # Validate output
                 validator = OutputValidator()
@@ -135,16 +138,21 @@ If data cannot be found, mark as "NOT_FOUND" with explanation.
     def _execute_synthesis(
         self,
         domain_prompt: str,
-        context: str
+        context: str,
+        static_prefix: Optional[str] = None
     ) -> Tuple[ParseResult, Dict[str, Any]]:
         """
         Execute a single synthesis API call.
 
-        Decorated with retry logic for transient failures.
+        Decorated with retry logic for transient failures. When a
+        static prefix is supplied it is sent as a system block marked
+        with cache_control so repeated calls within the cache TTL are
+        billed at the cheaper cache-read rate.
 
         Args:
             domain_prompt: The synthesis prompt
             context: Search results and content context
+            static_prefix: Optional cacheable prompt prefix
 
         Returns:
             Tuple of (ParseResult, metrics dict)
@@ -159,6 +167,19 @@ If data cannot be found, mark as "NOT_FOUND" with explanation.
             }
         ]
 
+        request_kwargs: Dict[str, Any] = {}
+        if static_prefix:
+            request_kwargs['system'] = [
+                {
+                    "type": "text",
+                    "text": static_prefix,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ]
+            request_kwargs['extra_headers'] = {
+                "anthropic-beta": "prompt-caching-2024-07-31"
+            }
+
         # Count input tokens
         input_tokens = self.token_manager.count_tokens(full_content)
 
@@ -168,13 +189,20 @@ If data cannot be found, mark as "NOT_FOUND" with explanation.
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=self.max_output_tokens,
-                messages=messages
+                messages=messages,
+                **request_kwargs
             )
 
             duration_ms = int((time.time() - start_time) * 1000)
             output_text = response.content[0].text
             output_tokens = response.usage.output_tokens
             actual_input_tokens = response.usage.input_tokens
+            cache_creation_tokens = getattr(
+                response.usage, 'cache_creation_input_tokens', 0
+            ) or 0
+            cache_read_tokens = getattr(
+                response.usage, 'cache_read_input_tokens', 0
+            ) or 0
 
             # Track costs
             if self.cost_tracker:
@@ -182,7 +210,9 @@ If data cannot be found, mark as "NOT_FOUND" with explanation.
                     input_tokens=actual_input_tokens,
                     output_tokens=output_tokens,
                     model=self.model,
-                    duration_ms=duration_ms
+                    duration_ms=duration_ms,
+                    cache_creation_tokens=cache_creation_tokens,
+                    cache_read_tokens=cache_read_tokens
                 )
 
             # Parse output
@@ -191,6 +221,8 @@ If data cannot be found, mark as "NOT_FOUND" with explanation.
             metrics = {
                 'input_tokens': actual_input_tokens,
                 'output_tokens': output_tokens,
+                'cache_creation_input_tokens': cache_creation_tokens,
+                'cache_read_input_tokens': cache_read_tokens,
                 'duration_ms': duration_ms,
                 'parse_success': parse_result.success,
                 'parse_method': parse_result.parse_method,
@@ -201,6 +233,7 @@ If data cannot be found, mark as "NOT_FOUND" with explanation.
 
             logger.info(
                 f"Synthesis completed: {actual_input_tokens} in, {output_tokens} out, "
+                f"{cache_read_tokens} cached, "
                 f"parse={parse_result.success} ({parse_result.parse_method})"
             )
 
@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import json
+import threading
 from pathlib import Path
 import logging
 
@@ -115,6 +116,11 @@ class CostTracker:
         'claude_opus_output': 75.0 / 1_000_000,
     }
 
+    # Prompt caching multipliers (relative to the input rate):
+    # cache writes cost 25% extra, cache reads cost 10% of the input rate
+    CACHE_WRITE_MULTIPLIER = 1.25
+    CACHE_READ_MULTIPLIER = 0.10
+
     def __init__(
         self,
         session_id: str,
@@ -141,7 +147,18 @@ class CostTracker:
             country=country,
             started_at=datetime.now()
         )
-        self._current_domain: Optional[int] = None
+        # Thread-local so each worker thread tracks its own domain when
+        # domains run in parallel
+        self._local = threading.local()
+
+    @property
+    def _current_domain(self) -> Optional[int]:
+        """Domain currently being tracked on this thread."""
+        return getattr(self._local, 'domain_id', None)
+
+    @_current_domain.setter
+    def _current_domain(self, domain_id: Optional[int]) -> None:
+        self._local.domain_id = domain_id
 
     def start_domain(self, domain_id: int, domain_name: str = "") -> None:
         """
@@ -239,18 +256,22 @@ class CostTracker:
         model: str = "sonnet",
         duration_ms: int = 0,
         success: bool = True,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        cache_creation_tokens: int = 0,
+        cache_read_tokens: int = 0
     ) -> None:
         """
         Record a Claude API call.
 
         Args:
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
             model: Model name (sonnet or opus)
             duration_ms: Call duration in milliseconds
             success: Whether call was successful
             error: Error message if failed
+            cache_creation_tokens: Tokens written to the prompt cache
+            cache_read_tokens: Tokens read from the prompt cache
         """
         if self._current_domain is None:
             return
@@ -259,21 +280,26 @@ class CostTracker:
         if not domain:
             return
 
+        total_input = input_tokens + cache_creation_tokens + cache_read_tokens
+
         domain.claude_calls += 1
-        domain.total_input_tokens += input_tokens
+        domain.total_input_tokens += total_input
         domain.total_output_tokens += output_tokens
 
-        # Calculate cost
+        # Calculate cost, billing cached prefix tokens at their own rates
         if 'opus' in model.lower():
-            cost = (
-                input_tokens * self.PRICING['claude_opus_input'] +
-                output_tokens * self.PRICING['claude_opus_output']
-            )
+            input_rate = self.PRICING['claude_opus_input']
+            output_rate = self.PRICING['claude_opus_output']
         else:
-            cost = (
-                input_tokens * self.PRICING['claude_sonnet_input'] +
-                output_tokens * self.PRICING['claude_sonnet_output']
-            )
+            input_rate = self.PRICING['claude_sonnet_input']
+            output_rate = self.PRICING['claude_sonnet_output']
+
+        cost = (
+            input_tokens * input_rate +
+            cache_creation_tokens * input_rate * self.CACHE_WRITE_MULTIPLIER +
+            cache_read_tokens * input_rate * self.CACHE_READ_MULTIPLIER +
+            output_tokens * output_rate
+        )
 
         domain.total_cost_usd += cost
 
@@ -96,11 +96,28 @@ retry_fetch = create_retry_decorator(
 )
 
 
+# Response headers advertising remaining request quota, in the order
+# we check them (Anthropic style first, then common x-ratelimit forms)
+_REMAINING_HEADERS = (
+    'anthropic-ratelimit-requests-remaining',
+    'x-ratelimit-remaining-requests',
+    'x-ratelimit-remaining',
+)
+
+_LIMIT_HEADERS = (
+    'anthropic-ratelimit-requests-limit',
+    'x-ratelimit-limit-requests',
+    'x-ratelimit-limit',
+)
+
+
 class AdaptiveRateLimiter:
     """
     Adaptive rate limiter that adjusts based on API responses.
 
     Increases delay on rate limits, decreases on consecutive successes.
+    Also reacts to rate-limit response headers (remaining quota,
+    Retry-After) so it only pauses when capacity is actually low.
     """
 
     def __init__(
@@ -122,14 +139,86 @@ class AdaptiveRateLimiter:
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
         self._consecutive_successes = 0
-        self._lock = asyncio.Lock() if asyncio.get_event_loop().is_running() else None
+        self._next_allowed = 0.0
+
+    def observe_response(self, headers, status_code: int) -> None:
+        """
+        Update limiter state from an API response.
+
+        Parses remaining-quota and Retry-After headers; when quota is
+        nearly exhausted (or on 429), schedules a pause before the next
+        request.
+
+        Args:
+            headers: Response headers (mapping with case-insensitive get)
+            status_code: HTTP status code of the response
+        """
+        retry_after = headers.get('retry-after')
+        try:
+            retry_after = float(retry_after) if retry_after else None
+        except ValueError:
+            retry_after = None
+
+        if status_code == 429:
+            self.on_rate_limit(retry_after)
+            self._next_allowed = time.time() + (retry_after or self.current_delay)
+            return
+
+        # Only real successes feed the streak that shrinks the delay;
+        # other error statuses are left to handle_http_error to classify
+        if status_code != 200:
+            return
+
+        self.on_success()
+
+        # Pre-emptively back off when the advertised quota is nearly gone
+        remaining = self._parse_header(headers, _REMAINING_HEADERS)
+        limit = self._parse_header(headers, _LIMIT_HEADERS)
+
+        if remaining is not None:
+            nearly_exhausted = remaining <= 2 or (
+                limit is not None and limit > 0 and remaining / limit < 0.1
+            )
+            if nearly_exhausted:
+                pause = retry_after or self.current_delay
+                self._next_allowed = time.time() + pause
+                logger.warning(
+                    f"Rate limiter: quota low ({remaining} remaining), "
+                    f"pausing {pause:.1f}s"
+                )
+
+    @staticmethod
+    def _parse_header(headers, names) -> Optional[float]:
+        """Return the first parseable numeric value among header names."""
+        for name in names:
+            value = headers.get(name)
+            if value is not None:
+                try:
+                    return float(value)
+                except ValueError:
+                    continue
+        return None
+
+    def wait_if_throttled_sync(self) -> None:
+        """Sleep until the header-scheduled pause has elapsed, if any."""
+        pause = self._next_allowed - time.time()
+        if pause > 0:
+            time.sleep(min(pause, self.max_delay))
+
+    async def wait_if_throttled(self) -> None:
+        """Async variant of `wait_if_throttled_sync`."""
+        pause = self._next_allowed - time.time()
+        if pause > 0:
+            await asyncio.sleep(min(pause, self.max_delay))
 
     def wait_sync(self) -> None:
         """Synchronous wait according to current rate limit."""
+        self.wait_if_throttled_sync()
         time.sleep(self.current_delay)
 
     async def wait(self) -> None:
         """Async wait according to current rate limit."""
+        await self.wait_if_throttled()
         await asyncio.sleep(self.current_delay)
 
     def on_success(self) -> None:
@@ -159,6 +248,7 @@ class AdaptiveRateLimiter:
         """Reset to base delay."""
         self.current_delay = self.base_delay
         self._consecutive_successes = 0
+        self._next_allowed = 0.0
 
 
 def handle_http_error(response: httpx.Response) -> None: